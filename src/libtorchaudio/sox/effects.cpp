@@ -1,7 +1,10 @@
+#include <ATen/MemoryOverlap.h>
+#include <ATen/Parallel.h>
 #include <libtorchaudio/sox/effects.h>
 #include <libtorchaudio/sox/effects_chain.h>
 #include <libtorchaudio/sox/utils.h>
 #include <sox.h>
+#include <algorithm>
 
 namespace torchaudio::sox {
 namespace {
@@ -45,10 +48,29 @@ void shutdown_sox_effects() {
   }
 }
 
-auto apply_effects_tensor(
+void prime_fft_cache(int64_t max_len) {
+  TORCH_CHECK(
+      max_len > 0 && max_len <= (1 << 17) && (max_len & (max_len - 1)) == 0,
+      "max_len has to be a power of two no greater than 131072. Found: ",
+      max_len);
+  // libsox does not export its FFT functions. The cache is grown when a DFT
+  // based filter starts, to the DFT length of the filter, which is about four
+  // times the number of taps. (lsx_set_dft_length, limited to [2^10, 2^17])
+  // So start a sinc filter with max_len / 4 taps on a single frame.
+  // (within the range of taps accepted by sinc)
+  const auto num_taps =
+      std::to_string(std::clamp<int64_t>(max_len / 4 + 1, 11, 32767));
+  apply_effects_tensor(
+      torch::zeros({1, 1}, torch::kFloat32),
+      8000,
+      {{"sinc", "-n", num_taps, "1000"}},
+      /*channels_first=*/true);
+}
+
+auto apply_effects_tensor_compiled(
     torch::Tensor waveform,
     int64_t sample_rate,
-    const std::vector<std::vector<std::string>>& effects,
+    const CompiledEffects& effects,
     bool channels_first) -> std::tuple<torch::Tensor, int64_t> {
   validate_input_tensor(waveform);
 
@@ -64,9 +86,7 @@ auto apply_effects_tensor(
 
   // Build and run effects chain
   chain.addInputTensor(&waveform, sample_rate, channels_first);
-  for (const auto& effect : effects) {
-    chain.addEffect(effect);
-  }
+  chain.addEffects(effects);
   chain.addOutputBuffer(&out_buffer);
   chain.run();
 
@@ -83,22 +103,233 @@ auto apply_effects_tensor(
       out_tensor, chain.getOutputSampleRate());
 }
 
-auto apply_effects_file(
-    const std::string& path,
+auto apply_effects_tensor(
+    torch::Tensor waveform,
+    int64_t sample_rate,
     const std::vector<std::vector<std::string>>& effects,
-    std::optional<bool> normalize,
-    std::optional<bool> channels_first,
-    const std::optional<std::string>& format)
-    -> std::tuple<torch::Tensor, int64_t> {
-  // Open input file
-  SoxFormat sf(sox_open_read(
-      path.c_str(),
-      /*signal=*/nullptr,
-      /*encoding=*/nullptr,
-      /*filetype=*/format.has_value() ? format.value().c_str() : nullptr));
+    bool channels_first) -> std::tuple<torch::Tensor, int64_t> {
+  return apply_effects_tensor_compiled(
+      waveform, sample_rate, CompiledEffects(effects), channels_first);
+}
 
-  validate_input_file(sf, path);
+auto apply_effects_tensor_into_compiled(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const CompiledEffects& effects,
+    bool channels_first,
+    torch::Tensor out) -> std::tuple<torch::Tensor, int64_t> {
+  validate_input_tensor(waveform);
+  TORCH_CHECK(out.device().is_cpu(), "Output tensor has to be on CPU.");
+  TORCH_CHECK(out.ndimension() == 2, "Output tensor has to be 2D.");
+  TORCH_CHECK(
+      out.dtype() == waveform.dtype(),
+      "Output tensor has to have the same dtype as the input tensor (",
+      waveform.dtype(),
+      "). Found: ",
+      out.dtype());
+  // The input is read while the output is written.
+  at::assert_no_internal_overlap(out);
+  at::assert_no_overlap(out, waveform);
+
+  // Create SoxEffectsChain
+  const auto dtype = waveform.dtype();
+  SoxEffectsChain chain(
+      /*input_encoding=*/get_tensor_encodinginfo(dtype),
+      /*output_encoding=*/get_tensor_encodinginfo(dtype));
+
+  // Build and run effects chain
+  const int64_t channel_dim = channels_first ? 0 : 1;
+  const int64_t time_dim = 1 - channel_dim;
+  OutputTensor output{out, channels_first};
+  chain.addInputTensor(&waveform, sample_rate, channels_first);
+  chain.addEffects(effects);
+  TORCH_CHECK(
+      out.size(channel_dim) == chain.getOutputNumChannels(),
+      "Output tensor has to have ",
+      chain.getOutputNumChannels(),
+      " channels. Found: ",
+      out.size(channel_dim));
+  chain.addOutputTensor(&output);
+  chain.run();
+  TORCH_CHECK(
+      !output.overflow,
+      "Output tensor is too small to hold the result. Found: ",
+      out.size(time_dim),
+      " frames.");
+
+  return std::tuple<torch::Tensor, int64_t>(
+      out.narrow(time_dim, 0, output.num_frames), chain.getOutputSampleRate());
+}
+
+auto apply_effects_tensor_into(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const std::vector<std::vector<std::string>>& effects,
+    bool channels_first,
+    torch::Tensor out) -> std::tuple<torch::Tensor, int64_t> {
+  return apply_effects_tensor_into_compiled(
+      waveform, sample_rate, CompiledEffects(effects), channels_first, out);
+}
+
+auto apply_effects_tensor_parallel_compiled(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const CompiledEffects& effects,
+    bool channels_first) -> std::tuple<torch::Tensor, int64_t> {
+  validate_input_tensor(waveform);
+
+  const auto dtype = waveform.dtype();
+  const int64_t channel_dim = channels_first ? 0 : 1;
+  const int64_t num_channels = waveform.size(channel_dim);
+  TORCH_CHECK(num_channels > 0, "Input tensor has no channel.");
+
+  // Run one effects chain per channel. Each chain only touches its own slot.
+  std::vector<std::vector<sox_sample_t>> out_buffers(num_channels);
+  std::vector<int64_t> out_num_channels(num_channels);
+  std::vector<int64_t> out_sample_rates(num_channels);
+  at::parallel_for(0, num_channels, 1, [&](int64_t begin, int64_t end) {
+    for (int64_t c = begin; c < end; ++c) {
+      auto channel = waveform.narrow(channel_dim, c, 1);
+      SoxEffectsChain chain(
+          /*input_encoding=*/get_tensor_encodinginfo(dtype),
+          /*output_encoding=*/get_tensor_encodinginfo(dtype));
+      out_buffers[c].reserve(channel.numel());
+      chain.addInputTensor(&channel, sample_rate, channels_first);
+      chain.addEffects(effects);
+      chain.addOutputBuffer(&out_buffers[c]);
+      chain.run();
+      out_num_channels[c] = chain.getOutputNumChannels();
+      out_sample_rates[c] = chain.getOutputSampleRate();
+    }
+  });
+
+  // Gather the channels into one Tensor
+  std::vector<torch::Tensor> channels;
+  channels.reserve(num_channels);
+  for (int64_t c = 0; c < num_channels; ++c) {
+    TORCH_CHECK(
+        out_num_channels[c] == 1,
+        "Effects that change the number of channels cannot be applied per channel.");
+    TORCH_CHECK(
+        out_buffers[c].size() == out_buffers[0].size(),
+        "Applying the effects per channel resulted in different lengths: ",
+        out_buffers[0].size(),
+        " and ",
+        out_buffers[c].size(),
+        ". Apply the effects to all channels at once instead.");
+    channels.push_back(convert_to_tensor(
+        /*buffer=*/out_buffers[c].data(),
+        /*num_samples=*/out_buffers[c].size(),
+        /*num_channels=*/1,
+        dtype,
+        /*normalize=*/false,
+        /*channels_first=*/true));
+  }
+  auto out_tensor = torch::cat(channels, 0);
+  if (!channels_first) {
+    out_tensor = out_tensor.t().contiguous();
+  }
+  return std::tuple<torch::Tensor, int64_t>(out_tensor, out_sample_rates[0]);
+}
+
+auto apply_effects_tensor_parallel(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const std::vector<std::vector<std::string>>& effects,
+    bool channels_first) -> std::tuple<torch::Tensor, int64_t> {
+  return apply_effects_tensor_parallel_compiled(
+      waveform, sample_rate, CompiledEffects(effects), channels_first);
+}
+
+auto apply_effects_tensor_batch_compiled(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const CompiledEffects& effects,
+    torch::Tensor lengths,
+    bool channels_first) -> std::tuple<torch::Tensor, torch::Tensor, int64_t> {
+  TORCH_CHECK(waveform.ndimension() == 3, "Input tensor has to be 3D.");
+  const int64_t batch_size = waveform.size(0);
+  TORCH_CHECK(batch_size > 0, "Input tensor has no sample.");
+  TORCH_CHECK(
+      lengths.ndimension() == 1 && lengths.size(0) == batch_size,
+      "Lengths tensor has to be 1D with the batch size (",
+      batch_size,
+      ") elements. Found: ",
+      lengths.sizes());
+  // Dimensions of each sample
+  const int64_t channel_dim = channels_first ? 0 : 1;
+  const int64_t time_dim = 1 - channel_dim;
+  const int64_t num_frames = waveform.size(time_dim + 1);
+  lengths = lengths.to(torch::kCPU, torch::kInt64).contiguous();
+  const auto lengths_a = lengths.accessor<int64_t, 1>();
+  for (int64_t i = 0; i < batch_size; ++i) {
+    TORCH_CHECK(
+        0 <= lengths_a[i] && lengths_a[i] <= num_frames,
+        "Lengths have to be between 0 and the number of frames (",
+        num_frames,
+        "). Found: ",
+        lengths_a[i]);
+  }
+
+  // Run one effects chain per sample. Each chain only touches its own slot.
+  std::vector<torch::Tensor> outputs(batch_size);
+  std::vector<int64_t> out_sample_rates(batch_size);
+  at::parallel_for(0, batch_size, 1, [&](int64_t begin, int64_t end) {
+    for (int64_t i = begin; i < end; ++i) {
+      auto sample = waveform[i].narrow(time_dim, 0, lengths_a[i]);
+      std::tie(outputs[i], out_sample_rates[i]) = apply_effects_tensor_compiled(
+          sample, sample_rate, effects, channels_first);
+    }
+  });
+
+  // Gather the samples into one Tensor
+  const int64_t out_num_channels = outputs[0].size(channel_dim);
+  auto out_lengths = torch::empty({batch_size}, torch::kInt64);
+  auto out_lengths_a = out_lengths.accessor<int64_t, 1>();
+  for (int64_t i = 0; i < batch_size; ++i) {
+    TORCH_CHECK(
+        outputs[i].size(channel_dim) == out_num_channels,
+        "Applying the effects resulted in different numbers of channels: ",
+        out_num_channels,
+        " and ",
+        outputs[i].size(channel_dim));
+    TORCH_CHECK(
+        out_sample_rates[i] == out_sample_rates[0],
+        "Applying the effects resulted in different sample rates: ",
+        out_sample_rates[0],
+        " and ",
+        out_sample_rates[i]);
+    out_lengths_a[i] = outputs[i].size(time_dim);
+  }
+  const int64_t max_length = out_lengths.max().item<int64_t>();
+  const auto shape = channels_first
+      ? std::vector<int64_t>{batch_size, out_num_channels, max_length}
+      : std::vector<int64_t>{batch_size, max_length, out_num_channels};
+  auto out = torch::zeros(shape, outputs[0].options());
+  for (int64_t i = 0; i < batch_size; ++i) {
+    out[i].narrow(time_dim, 0, out_lengths_a[i]).copy_(outputs[i]);
+  }
+  return std::tuple<torch::Tensor, torch::Tensor, int64_t>(
+      out, out_lengths, out_sample_rates[0]);
+}
+
+auto apply_effects_tensor_batch(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const std::vector<std::vector<std::string>>& effects,
+    torch::Tensor lengths,
+    bool channels_first) -> std::tuple<torch::Tensor, torch::Tensor, int64_t> {
+  return apply_effects_tensor_batch_compiled(
+      waveform, sample_rate, CompiledEffects(effects), lengths, channels_first);
+}
 
+namespace {
+
+auto apply_effects_sox_format(
+    const SoxFormat& sf,
+    const CompiledEffects& effects,
+    std::optional<bool> normalize,
+    std::optional<bool> channels_first) -> std::tuple<torch::Tensor, int64_t> {
   const auto dtype = get_dtype(sf->encoding.encoding, sf->signal.precision);
 
   // Prepare output
@@ -111,9 +342,7 @@ auto apply_effects_file(
       /*output_encoding=*/get_tensor_encodinginfo(dtype));
 
   chain.addInputFile(sf);
-  for (const auto& effect : effects) {
-    chain.addEffect(effect);
-  }
+  chain.addEffects(effects);
   chain.addOutputBuffer(&out_buffer);
   chain.run();
 
@@ -130,4 +359,122 @@ auto apply_effects_file(
   return std::tuple<torch::Tensor, int64_t>(
       tensor, chain.getOutputSampleRate());
 }
+
+} // namespace
+
+auto apply_effects_file_compiled(
+    const std::string& path,
+    const CompiledEffects& effects,
+    std::optional<bool> normalize,
+    std::optional<bool> channels_first,
+    const std::optional<std::string>& format)
+    -> std::tuple<torch::Tensor, int64_t> {
+  // Open input file
+  SoxFormat sf(sox_open_read(
+      path.c_str(),
+      /*signal=*/nullptr,
+      /*encoding=*/nullptr,
+      /*filetype=*/format.has_value() ? format.value().c_str() : nullptr));
+
+  validate_input_file(sf, path);
+
+  return apply_effects_sox_format(sf, effects, normalize, channels_first);
+}
+
+auto apply_effects_memory_compiled(
+    void* buffer,
+    size_t buffer_size,
+    const CompiledEffects& effects,
+    std::optional<bool> normalize,
+    std::optional<bool> channels_first,
+    const std::string& format)
+    -> std::optional<std::tuple<torch::Tensor, int64_t>> {
+  // Note: libsox cannot rewind an in-memory stream for format detection,
+  // so the format must be given explicitly.
+  SoxFormat sf(sox_open_mem_read(
+      buffer,
+      buffer_size,
+      /*signal=*/nullptr,
+      /*encoding=*/nullptr,
+      /*filetype=*/format.c_str()));
+
+  // Failing to open is reported to the caller, which can read the file by
+  // path instead. Errors past this point are raised.
+  if (static_cast<sox_format_t*>(sf) == nullptr ||
+      sf->encoding.encoding == SOX_ENCODING_UNKNOWN) {
+    return std::nullopt;
+  }
+  return apply_effects_sox_format(sf, effects, normalize, channels_first);
+}
+
+auto apply_effects_file(
+    const std::string& path,
+    const std::vector<std::vector<std::string>>& effects,
+    std::optional<bool> normalize,
+    std::optional<bool> channels_first,
+    const std::optional<std::string>& format)
+    -> std::tuple<torch::Tensor, int64_t> {
+  return apply_effects_file_compiled(
+      path, CompiledEffects(effects), normalize, channels_first, format);
+}
+
+auto apply_effects_files(
+    const std::vector<std::string>& paths,
+    const std::vector<std::vector<std::string>>& effects,
+    std::optional<bool> normalize,
+    std::optional<bool> channels_first,
+    const std::optional<std::string>& format)
+    -> std::tuple<std::vector<torch::Tensor>, std::vector<int64_t>> {
+  // Each file gets its own effects chain, because the input encoding is
+  // fixed at chain creation and differs from file to file. What is shared
+  // is the single dispatch from Python and the compiled effects.
+  const CompiledEffects compiled(effects);
+  std::vector<torch::Tensor> tensors;
+  std::vector<int64_t> sample_rates;
+  tensors.reserve(paths.size());
+  sample_rates.reserve(paths.size());
+  for (const auto& path : paths) {
+    auto [tensor, sample_rate] = apply_effects_file_compiled(
+        path, compiled, normalize, channels_first, format);
+    tensors.push_back(std::move(tensor));
+    sample_rates.push_back(sample_rate);
+  }
+  return std::make_tuple(std::move(tensors), std::move(sample_rates));
+}
+
+auto apply_effects_files_parallel(
+    const std::vector<std::string>& paths,
+    const std::vector<std::vector<std::string>>& effects,
+    std::optional<bool> normalize,
+    std::optional<bool> channels_first,
+    const std::optional<std::string>& format,
+    std::optional<int64_t> num_threads)
+    -> std::tuple<std::vector<torch::Tensor>, std::vector<int64_t>> {
+  const int64_t num_files = static_cast<int64_t>(paths.size());
+  const int64_t max_threads = num_threads.value_or(at::get_num_threads());
+  TORCH_CHECK(
+      max_threads > 0,
+      "num_threads must be positive. Found: ",
+      max_threads);
+
+  // libsox is initialized once (see initialize_sox_effects) before any
+  // effect is applied. After that, independent chains (and their input
+  // files) can be run concurrently as long as they do not share state.
+  // Each iteration below builds its own chain, so only the compiled effects
+  // (read-only) and the output slots are shared, and each slot is written by
+  // exactly one iteration.
+  const CompiledEffects compiled(effects);
+  std::vector<torch::Tensor> tensors(num_files);
+  std::vector<int64_t> sample_rates(num_files);
+  // Chunk the work so that at most `max_threads` chunks are dispatched.
+  const int64_t grain_size = std::max<int64_t>(
+      1, (num_files + max_threads - 1) / max_threads);
+  at::parallel_for(0, num_files, grain_size, [&](int64_t begin, int64_t end) {
+    for (int64_t i = begin; i < end; ++i) {
+      std::tie(tensors[i], sample_rates[i]) = apply_effects_file_compiled(
+          paths[i], compiled, normalize, channels_first, format);
+    }
+  });
+  return std::make_tuple(std::move(tensors), std::move(sample_rates));
+}
 } // namespace torchaudio::sox
@@ -1,6 +1,7 @@
 #ifndef TORCHAUDIO_SOX_EFFECTS_H
 #define TORCHAUDIO_SOX_EFFECTS_H
 
+#include <libtorchaudio/sox/effects_chain.h>
 #include <libtorchaudio/sox/utils.h>
 #include <torch/script.h>
 
@@ -10,12 +11,97 @@ void initialize_sox_effects();
 
 void shutdown_sox_effects();
 
+/// Grow the FFT cache of libsox, which is shared by all the effects chains,
+/// to hold DFTs of up to `max_len` points, so that filters started later do
+/// not need to grow it.
+void prime_fft_cache(int64_t max_len);
+
+auto apply_effects_tensor_compiled(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const CompiledEffects& effects,
+    bool channels_first) -> std::tuple<torch::Tensor, int64_t>;
+
 auto apply_effects_tensor(
     torch::Tensor waveform,
     int64_t sample_rate,
     const std::vector<std::vector<std::string>>& effects,
     bool channels_first) -> std::tuple<torch::Tensor, int64_t>;
 
+/// Same as apply_effects_tensor_compiled, but the result is written to the
+/// preallocated Tensor `out`, which must have the same dtype as `waveform`,
+/// the number of channels of the result and enough frames to hold it.
+/// Returns the part of `out` which has been written.
+auto apply_effects_tensor_into_compiled(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const CompiledEffects& effects,
+    bool channels_first,
+    torch::Tensor out) -> std::tuple<torch::Tensor, int64_t>;
+
+auto apply_effects_tensor_into(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const std::vector<std::vector<std::string>>& effects,
+    bool channels_first,
+    torch::Tensor out) -> std::tuple<torch::Tensor, int64_t>;
+
+/// Same as apply_effects_tensor_compiled, but each channel is processed by
+/// its own effects chain, and the chains are run in parallel.
+/// The effects must process channels independently, must not change the
+/// number of channels, and must produce the same length for all channels.
+auto apply_effects_tensor_parallel_compiled(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const CompiledEffects& effects,
+    bool channels_first) -> std::tuple<torch::Tensor, int64_t>;
+
+auto apply_effects_tensor_parallel(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const std::vector<std::vector<std::string>>& effects,
+    bool channels_first) -> std::tuple<torch::Tensor, int64_t>;
+
+/// Apply effects to each sample of a 3D batch Tensor, `[batch, channel, time]`
+/// if `channels_first` else `[batch, time, channel]`, in parallel.
+/// Only the first `lengths[i]` frames of the i-th sample are used.
+/// Returns the results padded with zeros to the longest one, their lengths
+/// and the sample rate.
+auto apply_effects_tensor_batch_compiled(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const CompiledEffects& effects,
+    torch::Tensor lengths,
+    bool channels_first) -> std::tuple<torch::Tensor, torch::Tensor, int64_t>;
+
+auto apply_effects_tensor_batch(
+    torch::Tensor waveform,
+    int64_t sample_rate,
+    const std::vector<std::vector<std::string>>& effects,
+    torch::Tensor lengths,
+    bool channels_first) -> std::tuple<torch::Tensor, torch::Tensor, int64_t>;
+
+auto apply_effects_file_compiled(
+    const std::string& path,
+    const CompiledEffects& effects,
+    std::optional<bool> normalize,
+    std::optional<bool> channels_first,
+    const std::optional<std::string>& format)
+    -> std::tuple<torch::Tensor, int64_t>;
+
+/// Same as apply_effects_file_compiled, but the encoded audio is read from
+/// the given memory region (for example a memory-mapped file) instead of
+/// the file system. The memory must stay valid during the call.
+/// Returns std::nullopt if libsox cannot open the memory region as `format`.
+auto apply_effects_memory_compiled(
+    void* buffer,
+    size_t buffer_size,
+    const CompiledEffects& effects,
+    std::optional<bool> normalize,
+    std::optional<bool> channels_first,
+    const std::string& format)
+    -> std::optional<std::tuple<torch::Tensor, int64_t>>;
+
 auto apply_effects_file(
     const std::string& path,
     const std::vector<std::vector<std::string>>& effects,
@@ -24,6 +110,23 @@ auto apply_effects_file(
     const std::optional<std::string>& format)
     -> std::tuple<torch::Tensor, int64_t>;
 
+auto apply_effects_files(
+    const std::vector<std::string>& paths,
+    const std::vector<std::vector<std::string>>& effects,
+    std::optional<bool> normalize,
+    std::optional<bool> channels_first,
+    const std::optional<std::string>& format)
+    -> std::tuple<std::vector<torch::Tensor>, std::vector<int64_t>>;
+
+auto apply_effects_files_parallel(
+    const std::vector<std::string>& paths,
+    const std::vector<std::vector<std::string>>& effects,
+    std::optional<bool> normalize,
+    std::optional<bool> channels_first,
+    const std::optional<std::string>& format,
+    std::optional<int64_t> num_threads)
+    -> std::tuple<std::vector<torch::Tensor>, std::vector<int64_t>>;
+
 } // namespace torchaudio::sox
 
 #endif
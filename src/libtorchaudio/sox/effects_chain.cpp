@@ -1,13 +1,18 @@
 #include <libtorchaudio/sox/effects_chain.h>
 #include <libtorchaudio/sox/utils.h>
+#include <algorithm>
+#include <mutex>
 #include "c10/util/Exception.h"
 
-using namespace torch::indexing;
-
 namespace torchaudio::sox {
 
 namespace {
 
+/// Effects such as compand parse their options with strtok, which is not
+/// reentrant, so the options of effects are parsed one chain at a time even
+/// when chains are built concurrently.
+std::mutex EFFECT_OPTIONS_MUTEX;
+
 /// helper classes for passing the location of input tensor and output buffer
 ///
 /// drain/flow callback functions require plaing C style function signature and
@@ -23,16 +28,57 @@ struct TensorInputPriv {
 struct TensorOutputPriv {
   std::vector<sox_sample_t>* buffer;
 };
+struct OutputTensorPriv {
+  OutputTensor* output;
+};
 struct FileOutputPriv {
   sox_format_t* sf;
 };
 
+/// Read `num_frames` frames starting at `i_frame` from a 2D Tensor of any
+/// strides, and write them to `obuf` as interleaved sox_sample_t.
+template <typename scalar_t, typename ConvertFn>
+void write_interleaved(
+    const torch::Tensor& tensor,
+    bool channels_first,
+    int64_t i_frame,
+    int64_t num_frames,
+    int64_t num_channels,
+    sox_sample_t* obuf,
+    ConvertFn convert) {
+  const auto accessor = tensor.accessor<scalar_t, 2>();
+  for (int64_t f = i_frame; f < i_frame + num_frames; ++f) {
+    for (int64_t c = 0; c < num_channels; ++c) {
+      *obuf++ = convert(channels_first ? accessor[c][f] : accessor[f][c]);
+    }
+  }
+}
+
+/// Read `num_frames` interleaved frames from `ibuf`, and write them to a 2D
+/// Tensor of any strides, starting at frame `o_frame`.
+template <typename scalar_t, typename ConvertFn>
+void read_interleaved(
+    const sox_sample_t* ibuf,
+    int64_t num_frames,
+    int64_t num_channels,
+    torch::Tensor& tensor,
+    bool channels_first,
+    int64_t o_frame,
+    ConvertFn convert) {
+  auto accessor = tensor.accessor<scalar_t, 2>();
+  for (int64_t f = o_frame; f < o_frame + num_frames; ++f) {
+    for (int64_t c = 0; c < num_channels; ++c) {
+      (channels_first ? accessor[c][f] : accessor[f][c]) = convert(*ibuf++);
+    }
+  }
+}
+
 /// Callback function to feed Tensor data to SoxEffectChain.
 int tensor_input_drain(sox_effect_t* effp, sox_sample_t* obuf, size_t* osamp) {
   // Retrieve the input Tensor and current index
   auto priv = static_cast<TensorInputPriv*>(effp->priv);
   auto index = priv->index;
-  auto tensor = *(priv->waveform);
+  const auto& tensor = *(priv->waveform);
   auto num_channels = effp->out_signal.channels;
 
   // Adjust the number of samples to read
@@ -43,47 +89,68 @@ int tensor_input_drain(sox_effect_t* effp, sox_sample_t* obuf, size_t* osamp) {
   // Ensure that it's a multiple of the number of channels
   *osamp -= *osamp % num_channels;
 
-  // Slice the input Tensor
-  auto chunk = [&]() {
-    auto i_frame = index / num_channels;
-    auto num_frames = *osamp / num_channels;
-    auto t = (priv->channels_first)
-        ? tensor.index({Slice(), Slice(i_frame, i_frame + num_frames)}).t()
-        : tensor.index({Slice(i_frame, i_frame + num_frames), Slice()});
-    return t.reshape({-1});
-  }();
-
-  // Convert to sox_sample_t (int32_t)
-  switch (chunk.dtype().toScalarType()) {
+  // Convert to sox_sample_t (int32_t) while reading the Tensor memory in
+  // place, so that no intermediate Tensor is created regardless of the
+  // memory layout of the input.
+  const int64_t i_frame = index / num_channels;
+  const int64_t num_frames = *osamp / num_channels;
+  const bool channels_first = priv->channels_first;
+  switch (tensor.scalar_type()) {
     case c10::ScalarType::Float: {
-      // Need to convert to 64-bit precision so that
-      // values around INT32_MIN/MAX are handled correctly.
-      chunk = chunk.to(c10::ScalarType::Double);
-      chunk *= 2147483648.;
-      chunk.clamp_(INT32_MIN, INT32_MAX);
-      chunk = chunk.to(c10::ScalarType::Int);
+      write_interleaved<float>(
+          tensor,
+          channels_first,
+          i_frame,
+          num_frames,
+          num_channels,
+          obuf,
+          [](float v) {
+            // Need to convert to 64-bit precision so that
+            // values around INT32_MIN/MAX are handled correctly.
+            double d = static_cast<double>(v) * 2147483648.;
+            d = std::min<double>(std::max<double>(d, INT32_MIN), INT32_MAX);
+            return static_cast<sox_sample_t>(d);
+          });
       break;
     }
     case c10::ScalarType::Int: {
+      write_interleaved<int32_t>(
+          tensor,
+          channels_first,
+          i_frame,
+          num_frames,
+          num_channels,
+          obuf,
+          [](int32_t v) { return static_cast<sox_sample_t>(v); });
       break;
     }
     case c10::ScalarType::Short: {
-      chunk = chunk.to(c10::ScalarType::Int);
-      chunk *= 65536;
+      write_interleaved<int16_t>(
+          tensor,
+          channels_first,
+          i_frame,
+          num_frames,
+          num_channels,
+          obuf,
+          [](int16_t v) { return static_cast<sox_sample_t>(v) * 65536; });
       break;
     }
     case c10::ScalarType::Byte: {
-      chunk = chunk.to(c10::ScalarType::Int);
-      chunk -= 128;
-      chunk *= 16777216;
+      write_interleaved<uint8_t>(
+          tensor,
+          channels_first,
+          i_frame,
+          num_frames,
+          num_channels,
+          obuf,
+          [](uint8_t v) {
+            return (static_cast<sox_sample_t>(v) - 128) * 16777216;
+          });
       break;
     }
     default:
-      TORCH_CHECK(false, "Unexpected dtype: ", chunk.dtype());
+      TORCH_CHECK(false, "Unexpected dtype: ", tensor.dtype());
   }
-  // Write to buffer
-  chunk = chunk.contiguous();
-  memcpy(obuf, chunk.data_ptr<int32_t>(), *osamp * 4);
   priv->index += *osamp;
   return (priv->index == num_samples) ? SOX_EOF : SOX_SUCCESS;
 }
@@ -103,6 +170,90 @@ int tensor_output_flow(
   return SOX_SUCCESS;
 }
 
+/// Callback function to write data from SoxEffectChain to a preallocated
+/// Tensor.
+int output_tensor_flow(
+    sox_effect_t* effp,
+    sox_sample_t const* ibuf,
+    sox_sample_t* obuf LSX_UNUSED,
+    size_t* isamp,
+    size_t* osamp) {
+  *osamp = 0;
+  auto output = static_cast<OutputTensorPriv*>(effp->priv)->output;
+  auto& tensor = output->tensor;
+  const bool channels_first = output->channels_first;
+  const int64_t num_channels = effp->in_signal.channels;
+  const int64_t num_frames = *isamp / num_channels;
+  if (output->num_frames + num_frames > tensor.size(channels_first ? 1 : 0)) {
+    output->overflow = true;
+    return SOX_EOF;
+  }
+
+  // Same conversions as convert_to_tensor with normalize=false
+  switch (tensor.scalar_type()) {
+    case c10::ScalarType::Float: {
+      read_interleaved<float>(
+          ibuf,
+          num_frames,
+          num_channels,
+          tensor,
+          channels_first,
+          output->num_frames,
+          [](sox_sample_t v) {
+            SOX_SAMPLE_LOCALS;
+            uint64_t clips = 0;
+            return static_cast<float>(SOX_SAMPLE_TO_FLOAT_32BIT(v, clips));
+          });
+      break;
+    }
+    case c10::ScalarType::Int: {
+      read_interleaved<int32_t>(
+          ibuf,
+          num_frames,
+          num_channels,
+          tensor,
+          channels_first,
+          output->num_frames,
+          [](sox_sample_t v) { return static_cast<int32_t>(v); });
+      break;
+    }
+    case c10::ScalarType::Short: {
+      read_interleaved<int16_t>(
+          ibuf,
+          num_frames,
+          num_channels,
+          tensor,
+          channels_first,
+          output->num_frames,
+          [](sox_sample_t v) {
+            SOX_SAMPLE_LOCALS;
+            uint64_t clips = 0;
+            return static_cast<int16_t>(SOX_SAMPLE_TO_SIGNED_16BIT(v, clips));
+          });
+      break;
+    }
+    case c10::ScalarType::Byte: {
+      read_interleaved<uint8_t>(
+          ibuf,
+          num_frames,
+          num_channels,
+          tensor,
+          channels_first,
+          output->num_frames,
+          [](sox_sample_t v) {
+            SOX_SAMPLE_LOCALS;
+            uint64_t clips = 0;
+            return static_cast<uint8_t>(SOX_SAMPLE_TO_UNSIGNED_8BIT(v, clips));
+          });
+      break;
+    }
+    default:
+      TORCH_CHECK(false, "Unexpected dtype: ", tensor.dtype());
+  }
+  output->num_frames += num_frames;
+  return SOX_SUCCESS;
+}
+
 int file_output_flow(
     sox_effect_t* effp,
     sox_sample_t const* ibuf,
@@ -156,6 +307,21 @@ sox_effect_handler_t* get_tensor_output_handler() {
   return &handler;
 }
 
+sox_effect_handler_t* get_output_tensor_handler() {
+  static sox_effect_handler_t handler{
+      /*name=*/"output_tensor",
+      /*usage=*/nullptr,
+      /*flags=*/SOX_EFF_MCHAN,
+      /*getopts=*/nullptr,
+      /*start=*/nullptr,
+      /*flow=*/output_tensor_flow,
+      /*drain=*/nullptr,
+      /*stop=*/nullptr,
+      /*kill=*/nullptr,
+      /*priv_size=*/sizeof(OutputTensorPriv)};
+  return &handler;
+}
+
 sox_effect_handler_t* get_file_output_handler() {
   static sox_effect_handler_t handler{
       /*name=*/"output_file",
@@ -189,6 +355,31 @@ auto SoxEffect::operator->() noexcept -> sox_effect_t* {
   return se_;
 }
 
+CompiledEffects::CompiledEffects(
+    const std::vector<std::vector<std::string>>& effects) {
+  entries_.reserve(effects.size());
+  for (const auto& effect : effects) {
+    TORCH_CHECK(effect.size() != 0, "Invalid argument: empty effect.");
+    const auto& name = effect[0];
+    TORCH_CHECK(
+        UNSUPPORTED_EFFECTS.find(name) == UNSUPPORTED_EFFECTS.end(),
+        "Unsupported effect: ",
+        name)
+    auto handler = sox_find_effect(name.c_str());
+    TORCH_CHECK(handler, "Unsupported effect: ", name)
+    entries_.push_back(Entry{handler, effect});
+  }
+}
+
+std::vector<std::vector<std::string>> CompiledEffects::getEffects() const {
+  std::vector<std::vector<std::string>> effects;
+  effects.reserve(entries_.size());
+  for (const auto& entry : entries_) {
+    effects.push_back(entry.effect);
+  }
+  return effects;
+}
+
 SoxEffectsChain::SoxEffectsChain(
     sox_encodinginfo_t input_encoding,
     sox_encodinginfo_t output_encoding)
@@ -237,6 +428,14 @@ void SoxEffectsChain::addOutputBuffer(
       "Internal Error: Failed to add effect: output_tensor");
 }
 
+void SoxEffectsChain::addOutputTensor(OutputTensor* output) {
+  SoxEffect e(sox_create_effect(get_output_tensor_handler()));
+  static_cast<OutputTensorPriv*>(e->priv)->output = output;
+  TORCH_CHECK(
+      sox_add_effect(sec_, e, &interm_sig_, &in_sig_) == SOX_SUCCESS,
+      "Internal Error: Failed to add effect: output_tensor");
+}
+
 void SoxEffectsChain::addInputFile(sox_format_t* sf) {
   in_sig_ = sf->signal;
   interm_sig_ = in_sig_;
@@ -260,34 +459,38 @@ void SoxEffectsChain::addOutputFile(sox_format_t* sf) {
 }
 
 void SoxEffectsChain::addEffect(const std::vector<std::string>& effect) {
-  const auto num_args = effect.size();
-  TORCH_CHECK(num_args != 0, "Invalid argument: empty effect.");
-  const auto name = effect[0];
-  TORCH_CHECK(
-      UNSUPPORTED_EFFECTS.find(name) == UNSUPPORTED_EFFECTS.end(),
-      "Unsupported effect: ",
-      name)
-
-  auto returned_effect = sox_find_effect(name.c_str());
-  TORCH_CHECK(returned_effect, "Unsupported effect: ", name)
-
-  SoxEffect e(sox_create_effect(returned_effect));
-  const auto num_options = num_args - 1;
+  addEffects(CompiledEffects(std::vector<std::vector<std::string>>{effect}));
+}
 
-  std::vector<char*> opts;
-  for (size_t i = 1; i < num_args; ++i) {
-    opts.push_back((char*)effect[i].c_str());
+void SoxEffectsChain::addEffects(const CompiledEffects& effects) {
+  for (const auto& entry : effects.entries_) {
+    SoxEffect e(sox_create_effect(entry.handler));
+    // Note: effects such as compand parse their options with strtok, which
+    // writes into the strings, so the shared strings must not be passed.
+    auto& strings = options_.emplace_back(
+        entry.effect.begin() + 1, entry.effect.end());
+    std::vector<char*> options;
+    options.reserve(strings.size());
+    for (auto& option : strings) {
+      options.push_back(option.data());
+    }
+    const auto num_options = options.size();
+    int status;
+    {
+      const std::lock_guard<std::mutex> lock(EFFECT_OPTIONS_MUTEX);
+      status = sox_effect_options(
+          e, num_options, num_options ? options.data() : nullptr);
+    }
+    TORCH_CHECK(
+        status == SOX_SUCCESS,
+        "Invalid effect option: ",
+        c10::Join(" ", entry.effect))
+    TORCH_CHECK(
+        sox_add_effect(sec_, e, &interm_sig_, &in_sig_) == SOX_SUCCESS,
+        "Internal Error: Failed to add effect: \"",
+        c10::Join(" ", entry.effect),
+        "\"");
   }
-  TORCH_CHECK(
-      sox_effect_options(e, num_options, num_options ? opts.data() : nullptr) ==
-          SOX_SUCCESS,
-      "Invalid effect option: ",
-      c10::Join(" ", effect))
-  TORCH_CHECK(
-      sox_add_effect(sec_, e, &interm_sig_, &in_sig_) == SOX_SUCCESS,
-      "Internal Error: Failed to add effect: \"",
-      c10::Join(" ", effect),
-      "\"");
 }
 
 int64_t SoxEffectsChain::getOutputNumChannels() {
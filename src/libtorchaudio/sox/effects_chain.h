@@ -3,6 +3,7 @@
 
 #include <libtorchaudio/sox/utils.h>
 #include <sox.h>
+#include <deque>
 
 namespace torchaudio::sox {
 
@@ -23,6 +24,38 @@ struct SoxEffect {
   sox_effect_t* se_;
 };
 
+// Effects description which has been validated and looked up once, so that
+// it can be added to many effects chains without searching the handlers.
+// It is shared via std::shared_ptr.
+class CompiledEffects {
+  struct Entry {
+    const sox_effect_handler_t* handler;
+    std::vector<std::string> effect;
+  };
+  std::vector<Entry> entries_;
+
+ public:
+  explicit CompiledEffects(
+      const std::vector<std::vector<std::string>>& effects);
+  CompiledEffects(const CompiledEffects& other) = delete;
+  CompiledEffects(CompiledEffects&& other) = delete;
+  CompiledEffects& operator=(const CompiledEffects& other) = delete;
+  CompiledEffects& operator=(CompiledEffects&& other) = delete;
+  std::vector<std::vector<std::string>> getEffects() const;
+
+  friend class SoxEffectsChain;
+};
+
+// Preallocated 2D Tensor which an effects chain writes its output to.
+// If the Tensor is too small to hold the output, `overflow` is set and the
+// chain is stopped.
+struct OutputTensor {
+  torch::Tensor tensor;
+  bool channels_first;
+  int64_t num_frames = 0;
+  bool overflow = false;
+};
+
 // Helper struct to safely close sox_effects_chain_t with handy methods
 class SoxEffectsChain {
   const sox_encodinginfo_t in_enc_;
@@ -33,6 +66,10 @@ class SoxEffectsChain {
   sox_signalinfo_t interm_sig_;
   sox_signalinfo_t out_sig_;
   sox_effects_chain_t* sec_;
+  // Option strings given to the effects of this chain. Some effects tokenize
+  // their options in place, so each chain passes its own copy, and keeps it
+  // alive as long as the effects.
+  std::deque<std::vector<std::string>> options_;
 
  public:
   explicit SoxEffectsChain(
@@ -50,8 +87,10 @@ class SoxEffectsChain {
       bool channels_first);
   void addInputFile(sox_format_t* sf);
   void addOutputBuffer(std::vector<sox_sample_t>* output_buffer);
+  void addOutputTensor(OutputTensor* output);
   void addOutputFile(sox_format_t* sf);
   void addEffect(const std::vector<std::string>& effect);
+  void addEffects(const CompiledEffects& effects);
   int64_t getOutputNumChannels();
   int64_t getOutputSampleRate();
 };
@@ -14,7 +14,22 @@ TORCH_LIBRARY(torchaudio_sox, m) {
   m.def("torchaudio_sox::initialize_sox_effects", &initialize_sox_effects);
   m.def("torchaudio_sox::shutdown_sox_effects", &shutdown_sox_effects);
   m.def("torchaudio_sox::apply_effects_tensor", &apply_effects_tensor);
+  m.def(
+      "torchaudio_sox::apply_effects_tensor_into("
+      "Tensor waveform, int sample_rate, str[][] effects, bool channels_first, "
+      "Tensor(a!) out) -> (Tensor(a!), int)",
+      &apply_effects_tensor_into);
+  m.def(
+      "torchaudio_sox::apply_effects_tensor_parallel",
+      &apply_effects_tensor_parallel);
+  m.def(
+      "torchaudio_sox::apply_effects_tensor_batch",
+      &apply_effects_tensor_batch);
   m.def("torchaudio_sox::apply_effects_file", &apply_effects_file);
+  m.def("torchaudio_sox::apply_effects_files", &apply_effects_files);
+  m.def(
+      "torchaudio_sox::apply_effects_files_parallel",
+      &apply_effects_files_parallel);
 }
 
 PYBIND11_MODULE(_torchaudio_sox, m) {
@@ -23,6 +38,11 @@ PYBIND11_MODULE(_torchaudio_sox, m) {
   m.def("set_use_threads", &set_use_threads, "Set threading.");
   m.def("set_buffer_size", &set_buffer_size, "Set buffer size.");
   m.def("get_buffer_size", &get_buffer_size, "Get buffer size.");
+  m.def(
+      "prime_fft_cache",
+      &prime_fft_cache,
+      py::call_guard<py::gil_scoped_release>(),
+      "Grow the FFT cache of libsox.");
   m.def("list_effects", &list_effects, "List available effects.");
   m.def(
       "list_read_formats",
@@ -32,6 +52,102 @@ PYBIND11_MODULE(_torchaudio_sox, m) {
       "list_write_formats",
       &list_write_formats,
       "List supported formats for encoding.");
+
+  py::class_<CompiledEffects, std::shared_ptr<CompiledEffects>>(
+      m, "CompiledEffects")
+      .def_property_readonly("effects", &CompiledEffects::getEffects);
+  m.def(
+      "compile_effects",
+      [](const std::vector<std::vector<std::string>>& effects) {
+        return std::make_shared<CompiledEffects>(effects);
+      },
+      "Validate effects and convert them to the form passed to libsox.");
+  m.def(
+      "apply_effects_tensor_compiled",
+      [](torch::Tensor waveform,
+         int64_t sample_rate,
+         const std::shared_ptr<CompiledEffects>& effects,
+         bool channels_first) {
+        return apply_effects_tensor_compiled(
+            waveform, sample_rate, *effects, channels_first);
+      },
+      py::call_guard<py::gil_scoped_release>(),
+      "Apply compiled effects to Tensor.");
+  m.def(
+      "apply_effects_tensor_into_compiled",
+      [](torch::Tensor waveform,
+         int64_t sample_rate,
+         const std::shared_ptr<CompiledEffects>& effects,
+         bool channels_first,
+         torch::Tensor out) {
+        return apply_effects_tensor_into_compiled(
+            waveform, sample_rate, *effects, channels_first, out);
+      },
+      py::call_guard<py::gil_scoped_release>(),
+      "Apply compiled effects to Tensor and write the result to another "
+      "Tensor.");
+  m.def(
+      "apply_effects_tensor_parallel_compiled",
+      [](torch::Tensor waveform,
+         int64_t sample_rate,
+         const std::shared_ptr<CompiledEffects>& effects,
+         bool channels_first) {
+        return apply_effects_tensor_parallel_compiled(
+            waveform, sample_rate, *effects, channels_first);
+      },
+      py::call_guard<py::gil_scoped_release>(),
+      "Apply compiled effects to each channel of Tensor in parallel.");
+  m.def(
+      "apply_effects_tensor_batch_compiled",
+      [](torch::Tensor waveform,
+         int64_t sample_rate,
+         const std::shared_ptr<CompiledEffects>& effects,
+         torch::Tensor lengths,
+         bool channels_first) {
+        return apply_effects_tensor_batch_compiled(
+            waveform, sample_rate, *effects, lengths, channels_first);
+      },
+      py::call_guard<py::gil_scoped_release>(),
+      "Apply compiled effects to each sample of batch Tensor in parallel.");
+  m.def(
+      "apply_effects_path_obj",
+      [](const py::object& path,
+         const std::shared_ptr<CompiledEffects>& effects,
+         std::optional<bool> normalize,
+         std::optional<bool> channels_first,
+         const std::optional<std::string>& format) {
+        // Same as os.fspath: accepts str, bytes and os.PathLike objects.
+        auto fspath =
+            py::reinterpret_steal<py::object>(PyOS_FSPath(path.ptr()));
+        if (!fspath) {
+          throw py::error_already_set();
+        }
+        auto path_str = fspath.cast<std::string>();
+        py::gil_scoped_release release;
+        return apply_effects_file_compiled(
+            path_str, *effects, normalize, channels_first, format);
+      },
+      "Apply compiled effects to audio file given as path-like object.");
+  m.def(
+      "apply_effects_memory",
+      [](const py::buffer& buffer,
+         const std::shared_ptr<CompiledEffects>& effects,
+         std::optional<bool> normalize,
+         std::optional<bool> channels_first,
+         const std::string& format) {
+        // The buffer view has to be acquired and released with the GIL held.
+        py::buffer_info info = buffer.request();
+        py::gil_scoped_release release;
+        return apply_effects_memory_compiled(
+            info.ptr,
+            static_cast<size_t>(info.size * info.itemsize),
+            *effects,
+            normalize,
+            channels_first,
+            format);
+      },
+      "Apply compiled effects to encoded audio in a buffer. "
+      "Returns None if the buffer cannot be opened.");
 }
 
 } // namespace
@@ -90,6 +90,12 @@ def _init_sox():
     torch.ops.torchaudio_sox.initialize_sox_effects()
     atexit.register(torch.ops.torchaudio_sox.shutdown_sox_effects)
 
+    # Allocate the FFT cache of libsox up-front, so that effects such as ``rate``
+    # do not have to grow it while chains are run concurrently. libsox only guards
+    # the growth with a lock when built with OpenMP; otherwise concurrent growth
+    # is a data race, which this avoids for the parallel paths.
+    ext.prime_fft_cache(65536)
+
     # Bundle functions registered with TORCH_LIBRARY into extension
     # so that they can also be accessed in the same (lazy) manner
     # from the extension.
@@ -98,7 +104,12 @@ def _init_sox():
         "load_audio_file",
         "save_audio_file",
         "apply_effects_tensor",
+        "apply_effects_tensor_into",
+        "apply_effects_tensor_batch",
+        "apply_effects_tensor_parallel",
         "apply_effects_file",
+        "apply_effects_files",
+        "apply_effects_files_parallel",
     ]
     for key in keys:
         setattr(ext, key, getattr(torch.ops.torchaudio_sox, key))
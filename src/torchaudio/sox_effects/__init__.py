@@ -1,10 +1,26 @@
-from .sox_effects import apply_effects_file, apply_effects_tensor, effect_names, init_sox_effects, shutdown_sox_effects
+from .sox_effects import (
+    EffectChain,
+    apply_effects_file,
+    apply_effects_file_async,
+    apply_effects_files,
+    apply_effects_files_parallel,
+    apply_effects_tensor,
+    apply_effects_tensor_batch,
+    effect_names,
+    init_sox_effects,
+    shutdown_sox_effects,
+)
 
 
 __all__ = [
+    "EffectChain",
     "init_sox_effects",
     "shutdown_sox_effects",
     "effect_names",
     "apply_effects_tensor",
+    "apply_effects_tensor_batch",
     "apply_effects_file",
+    "apply_effects_file_async",
+    "apply_effects_files",
+    "apply_effects_files_parallel",
 ]
@@ -1,15 +1,426 @@
+import atexit
+import functools
+import math
+import mmap
 import os
+import queue
+import stat
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional, Tuple
 
 import torch
 import torchaudio
-from torchaudio._internal.module_utils import deprecated, dropping_support
+from torchaudio._backend.utils import get_available_backends
+from torchaudio._internal.module_utils import deprecated, dropping_class_support, dropping_support, eval_env
+from torchaudio.functional.functional import _apply_sinc_resample_kernel, _get_sinc_resample_kernel
 from torchaudio.utils.sox_utils import list_effects
 
 
 sox_ext = torchaudio._extension.lazy_import_sox_ext()
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_effects(effects: Tuple[Tuple[str, ...], ...]):
+    # Effects are validated and converted to libsox arguments once per unique
+    # description, so that the common case of applying the same effects
+    # to many samples does not pay the conversion for each call.
+    return sox_ext.compile_effects([list(effect) for effect in effects])
+
+
+@dropping_class_support
+class EffectChain:
+    """Effects which have been validated and converted to the arguments of libsox
+
+    Passing an ``EffectChain`` instead of ``List[List[str]]`` to :py:func:`apply_effects_tensor`,
+    :py:func:`apply_effects_tensor_batch` and :py:func:`apply_effects_file` skips the conversion
+    on every call, which helps when the same effects are applied to many samples,
+    for example in a dataset.
+
+    Args:
+        effects (List[List[str]]): List of effects.
+
+    Example
+        >>> chain = EffectChain([["lowpass", "-1", "300"], ["vol", "0.5"]])
+        >>> waveform, sample_rate = apply_effects_tensor(waveform, sample_rate, chain)
+    """
+
+    def __init__(self, effects: List[List[str]]):
+        self._effects = [list(effect) for effect in effects]
+        # Shares the compiled effects with the calls made with the same list of effects.
+        self._handle = _compile_effects(tuple(map(tuple, effects)))
+
+    @property
+    def effects(self) -> List[List[str]]:
+        """List[List[str]]: The effects of the chain."""
+        return [list(effect) for effect in self._effects]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.effects!r})"
+
+    def __reduce__(self):
+        # The compiled effects can not be pickled, so they are compiled again on unpickling,
+        # for example when a dataset holding the chain is sent to DataLoader workers.
+        return (EffectChain, (self._effects,))
+
+
+def _get_compiled(effects):
+    if isinstance(effects, EffectChain):
+        return effects._handle
+    return _compile_effects(tuple(map(tuple, effects)))
+
+
+# Threads on which libsox is called directly, even when the worker thread is enabled.
+_THREAD_STATE = threading.local()
+
+
+def _mark_inline_thread():
+    _THREAD_STATE.inline = True
+
+
+class _SoxWorker(threading.Thread):
+    """Long-lived thread which runs the libsox calls of :py:func:`apply_effects_tensor`
+    and :py:func:`apply_effects_tensor_batch`.
+
+    Only used when ``TORCHAUDIO_SOX_WORKER=1`` is set. libsox is initialized once per
+    process either way; the worker keeps threads which apply effects to Tensors from
+    calling into libsox concurrently, so these calls are serialized. It does not own the
+    global state of libsox: with ``parallel_channels`` (and for batches of channel-wise
+    effects), the effects chains are run on the intra-op thread pool, and the file functions
+    as well as the calls from the thread pool of :py:func:`apply_effects_file_async` call
+    libsox on their own thread.
+    """
+
+    _instance: Optional["_SoxWorker"] = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        super().__init__(name="torchaudio_sox_worker", daemon=True)
+        self._jobs = queue.Queue()
+
+    def run(self):
+        _mark_inline_thread()
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, func, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def stop(self):
+        self._jobs.put(None)
+        self.join()
+
+    @classmethod
+    def submit(cls, func, *args) -> Future:
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                cls._instance.start()
+                # Registered after libsox is initialized, so that the worker is joined
+                # before libsox is shut down.
+                atexit.register(cls._shutdown)
+            worker = cls._instance
+        future = Future()
+        worker._jobs.put((future, func, args))
+        return future
+
+    @classmethod
+    def _shutdown(cls):
+        with cls._lock:
+            worker, cls._instance = cls._instance, None
+        if worker is not None and worker.is_alive():
+            worker.stop()
+
+    @classmethod
+    def _reset(cls):
+        # The worker thread does not survive fork, so the child process starts its own on first use.
+        cls._instance = None
+        cls._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_SoxWorker._reset)
+
+
+# When enabled, the libsox calls of apply_effects_tensor are run on the worker thread instead of
+# the calling thread. As the worker runs one call at a time, this serializes such calls in the process.
+_USE_SOX_WORKER = eval_env("TORCHAUDIO_SOX_WORKER", False)
+
+
+def _run_sox(func, *args):
+    if not _USE_SOX_WORKER or getattr(_THREAD_STATE, "inline", False):
+        return func(*args)
+    return _SoxWorker.submit(func, *args).result()
+
+
+def _sox_apply_effects_tensor(
+    tensor: torch.Tensor,
+    sample_rate: int,
+    effects: List[List[str]],
+    channels_first: bool,
+    parallel_channels: bool,
+) -> Tuple[torch.Tensor, int]:
+    if not torch.jit.is_scripting():
+        compiled = _get_compiled(effects)
+        if parallel_channels:
+            func = sox_ext.apply_effects_tensor_parallel_compiled
+        else:
+            func = sox_ext.apply_effects_tensor_compiled
+        return _run_sox(func, tensor, sample_rate, compiled, channels_first)
+    if parallel_channels:
+        return sox_ext.apply_effects_tensor_parallel(tensor, sample_rate, effects, channels_first)
+    return sox_ext.apply_effects_tensor(tensor, sample_rate, effects, channels_first)
+
+
+def _sox_apply_effects_tensor_into(
+    tensor: torch.Tensor,
+    sample_rate: int,
+    effects: List[List[str]],
+    channels_first: bool,
+    out: torch.Tensor,
+) -> Tuple[torch.Tensor, int]:
+    if not torch.jit.is_scripting():
+        compiled = _get_compiled(effects)
+        return _run_sox(sox_ext.apply_effects_tensor_into_compiled, tensor, sample_rate, compiled, channels_first, out)
+    return sox_ext.apply_effects_tensor_into(tensor, sample_rate, effects, channels_first, out)
+
+
+def _validate_input_tensor(tensor: torch.Tensor):
+    # Same checks as the extension performs, so that invalid input is rejected
+    # before any work is done. Any memory layout is accepted: the extension reads
+    # the input through its strides, so non-contiguous input is never copied.
+    if tensor.device.type != "cpu":
+        raise RuntimeError("Input tensor has to be on CPU.")
+    if tensor.dim() != 2:
+        raise RuntimeError("Input tensor has to be 2D.")
+    if tensor.dtype not in [torch.float32, torch.int32, torch.int16, torch.uint8]:
+        raise RuntimeError("Input tensor has to be one of float32, int32, int16 or uint8 type.")
+
+
+def _is_noop(effects: List[List[str]], sample_rate: int, num_channels: int) -> bool:
+    """Check if the effects leave the waveform unchanged.
+
+    Only the effects which libsox itself treats as no-op are considered, that is,
+    ``channels`` with the current number of channels and ``rate`` with the current sample rate.
+    """
+    for effect in effects:
+        if len(effect) != 2:
+            return False
+        if effect[0] == "channels" and effect[1] == str(num_channels):
+            continue
+        if effect[0] == "rate" and effect[1] == str(sample_rate):
+            continue
+        return False
+    return True
+
+
+# Effects which process each channel independently and causally, without changing the length.
+# A batch of such effects can be run as one set of channels, and the padding does not affect the samples.
+_CHANNELWISE_EFFECTS = {
+    "allpass",
+    "band",
+    "bandpass",
+    "bandreject",
+    "bass",
+    "biquad",
+    "contrast",
+    "dcshift",
+    "deemph",
+    "equalizer",
+    "highpass",
+    "lowpass",
+    "overdrive",
+    "riaa",
+    "treble",
+    "vol",
+}
+
+
+def _is_channelwise(effects: List[List[str]]) -> bool:
+    return all(len(effect) > 0 and effect[0] in _CHANNELWISE_EFFECTS for effect in effects)
+
+
+# When enabled, plain ``["rate", "<int>"]`` effects in apply_effects_tensor are run with
+# torchaudio.functional.resample instead of libsox.
+_USE_FAST_RATE = eval_env("TORCHAUDIO_FAST_RATE", False)
+
+# The fast path is only taken when both sample rates divided by their gcd are at most this,
+# as the size of the resampling kernel grows with their product.
+_FAST_RATE_MAX_REDUCED_RATE = 1000
+
+
+def _split_rate(
+    effects: List[List[str]], sample_rate: int
+) -> Tuple[List[List[str]], Optional[int], List[List[str]]]:
+    """Split effects at the first ``rate`` effect that can be replaced with resampling.
+
+    Returns the effects before it, its target sample rate, and the effects after it.
+    When there is no such effect, the target sample rate is ``None``.
+    Only the plain form ``["rate", "<int>"]`` is replaced; ``rate`` with options
+    (such as quality flags) or a unit suffix is left to libsox.
+    It is also left to libsox when the sample rate it receives is not known exactly
+    (such as after ``speed``, where libsox reports a truncated rate), or when the pair of
+    sample rates would need a large resampling kernel.
+    """
+    current: Optional[int] = sample_rate
+    for i in range(len(effects)):
+        effect = effects[i]
+        if len(effect) == 2 and effect[0] == "rate" and effect[1].isdigit():
+            new_sr = int(effect[1])
+            if new_sr == 0:
+                # Invalid, libsox reports the error.
+                current = None
+                continue
+            if current is not None:
+                gcd = math.gcd(current, new_sr)
+                if current // gcd <= _FAST_RATE_MAX_REDUCED_RATE and new_sr // gcd <= _FAST_RATE_MAX_REDUCED_RATE:
+                    return effects[:i], new_sr, effects[i + 1 :]
+            current = new_sr
+        elif len(effect) > 0 and effect[0] in ["rate", "speed", "pitch", "upsample", "downsample"]:
+            current = None
+    return effects, None, []
+
+
+def _build_resample_kernel(
+    orig_freq: int, new_freq: int, dtype: torch.dtype, device: torch.device
+) -> Tuple[torch.Tensor, int]:
+    return _get_sinc_resample_kernel(
+        orig_freq,
+        new_freq,
+        1,
+        lowpass_filter_width=6,
+        rolloff=0.99,
+        resampling_method="sinc_interp_hann",
+        device=device,
+        dtype=dtype,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _get_resample_kernel(
+    orig_freq: int, new_freq: int, dtype: torch.dtype, device: torch.device
+) -> Tuple[torch.Tensor, int]:
+    # The kernel only depends on the pair of sample rates divided by their gcd, so it is
+    # built once and reused across calls. The returned Tensor must not be modified in-place.
+    return _build_resample_kernel(orig_freq, new_freq, dtype, device)
+
+
+def _resample(tensor: torch.Tensor, orig_freq: int, new_freq: int, channels_first: bool) -> torch.Tensor:
+    if orig_freq == new_freq:
+        # Returned as is, so that the caller can tell the input was not copied.
+        return tensor
+    if not channels_first:
+        tensor = tensor.transpose(0, 1)
+    if torch.jit.is_scripting():
+        tensor = torchaudio.functional.resample(
+            tensor,
+            orig_freq,
+            new_freq,
+            lowpass_filter_width=6,
+            rolloff=0.99,
+            resampling_method="sinc_interp_hann",
+        )
+    else:
+        gcd = math.gcd(orig_freq, new_freq)
+        orig_freq, new_freq = orig_freq // gcd, new_freq // gcd
+        if orig_freq <= _FAST_RATE_MAX_REDUCED_RATE and new_freq <= _FAST_RATE_MAX_REDUCED_RATE:
+            kernel, width = _get_resample_kernel(orig_freq, new_freq, tensor.dtype, tensor.device)
+        else:
+            # Large kernels are not kept in the cache.
+            kernel, width = _build_resample_kernel(orig_freq, new_freq, tensor.dtype, tensor.device)
+        tensor = _apply_sinc_resample_kernel(tensor, orig_freq, new_freq, 1, kernel, width)
+    if not channels_first:
+        tensor = tensor.transpose(0, 1)
+    return tensor.contiguous()
+
+
+def _apply_effects_tensor_fast_rate(
+    tensor: torch.Tensor,
+    sample_rate: int,
+    effects: List[List[str]],
+    channels_first: bool,
+    parallel_channels: bool,
+) -> Tuple[torch.Tensor, int]:
+    original = tensor
+    pre, new_sr, post = _split_rate(effects, sample_rate)
+    while new_sr is not None:
+        if len(pre) > 0:
+            tensor, sample_rate = _sox_apply_effects_tensor(tensor, sample_rate, pre, channels_first, parallel_channels)
+        tensor = _resample(tensor, sample_rate, new_sr, channels_first)
+        sample_rate = new_sr
+        pre, new_sr, post = _split_rate(post, sample_rate)
+    if len(pre) > 0:
+        tensor, sample_rate = _sox_apply_effects_tensor(tensor, sample_rate, pre, channels_first, parallel_channels)
+    if tensor is original:
+        # Same as libsox path, the returned Tensor never aliases the input.
+        tensor = tensor.clone(memory_format=torch.contiguous_format)
+    return tensor, sample_rate
+
+
+# Files smaller than this are read by libsox directly.
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _apply_effects_file_mmap(path, compiled, normalize: bool, channels_first: bool, format: Optional[str]):
+    """Apply effects to a large regular file by memory-mapping it.
+
+    ``path`` is a path-like object, which is only converted to ``str`` once the file is
+    known to be eligible. Returns ``None`` if the file is not eligible, cannot be mapped or
+    cannot be opened by libsox, in which case the caller should fall back to reading the
+    file by path. Errors raised while decoding the file or applying the effects propagate.
+    """
+    filetype = format if format is not None else os.path.splitext(os.fsdecode(path))[1][1:].lower()
+    if not filetype:
+        return None
+    try:
+        # A single stat, so files below the threshold are not opened here.
+        st = os.stat(path)
+        if not stat.S_ISREG(st.st_mode) or st.st_size < _MMAP_THRESHOLD:
+            return None
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            buffer = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+    except (OSError, ValueError):
+        return None
+    with buffer:
+        return sox_ext.apply_effects_memory(buffer, compiled, normalize, channels_first, filetype)
+
+
+# Effects which are always applied on the libsox file path of apply_effects_file.
+_FILE_ONLY_EFFECTS = {"synth", "stat", "stats", "spectrogram"}
+
+# When enabled, apply_effects_file decodes WAV and FLAC files with torchaudio.load.
+_USE_FILE_BACKEND = eval_env("TORCHAUDIO_SOX_FILE_BACKEND", False)
+
+
+def _get_file_backend(path, effects: List[List[str]], format: Optional[str]) -> Optional[str]:
+    """Get the backend of torchaudio.load to decode the file with.
+
+    Returns ``None`` if the file should be decoded by libsox instead.
+    """
+    if format is None:
+        format = os.path.splitext(os.fsdecode(path))[1][1:].lower()
+    if format not in ("wav", "flac"):
+        return None
+    if any(len(effect) > 0 and effect[0] in _FILE_ONLY_EFFECTS for effect in effects):
+        return None
+    backends = get_available_backends()
+    for backend in ("ffmpeg", "soundfile"):
+        if backend in backends:
+            return backend
+    return None
+
+
 @deprecated("Please remove the call. This function is called automatically.")
 def init_sox_effects():
     """Initialize resources required to use sox effects.
@@ -39,6 +450,10 @@ def shutdown_sox_effects():
     pass
 
 
+# The set of effects is fixed when libsox is loaded, so it is looked up once.
+_EFFECT_NAMES: Optional[Tuple[str, ...]] = None
+
+
 @dropping_support
 def effect_names() -> List[str]:
     """Gets list of valid sox effect names
@@ -50,7 +465,43 @@ def effect_names() -> List[str]:
         >>> torchaudio.sox_effects.effect_names()
         ['allpass', 'band', 'bandpass', ... ]
     """
-    return list(list_effects().keys())
+    global _EFFECT_NAMES
+    if _EFFECT_NAMES is None:
+        _EFFECT_NAMES = tuple(list_effects().keys())
+    return list(_EFFECT_NAMES)
+
+
+def _apply_effects_tensor(
+    tensor: torch.Tensor,
+    sample_rate: int,
+    effects: List[List[str]],
+    channels_first: bool,
+    parallel_channels: bool,
+    skip_noop: bool,
+    out: Optional[torch.Tensor],
+    out_dtype: Optional[torch.dtype],
+) -> Tuple[torch.Tensor, int]:
+    _validate_input_tensor(tensor)
+    effect_list = effects
+    if not torch.jit.is_scripting():
+        if isinstance(effects, EffectChain):
+            effect_list = effects._effects
+    if out is not None:
+        if out_dtype is not None:
+            raise ValueError("`out` and `out_dtype` cannot be used together.")
+        return _sox_apply_effects_tensor_into(tensor, sample_rate, effects, channels_first, out)
+    if skip_noop and _is_noop(effect_list, sample_rate, tensor.size(0 if channels_first else 1)):
+        dtype = tensor.dtype if out_dtype is None else out_dtype
+        return tensor.to(dtype=dtype, copy=True, memory_format=torch.contiguous_format), sample_rate
+    if _USE_FAST_RATE and tensor.dtype == torch.float32 and _split_rate(effect_list, sample_rate)[1] is not None:
+        result, sample_rate = _apply_effects_tensor_fast_rate(
+            tensor, sample_rate, effect_list, channels_first, parallel_channels
+        )
+    else:
+        result, sample_rate = _sox_apply_effects_tensor(tensor, sample_rate, effects, channels_first, parallel_channels)
+    if out_dtype is not None:
+        result = result.to(out_dtype)
+    return result, sample_rate
 
 
 @dropping_support
@@ -59,6 +510,10 @@ def apply_effects_tensor(
     sample_rate: int,
     effects: List[List[str]],
     channels_first: bool = True,
+    parallel_channels: bool = False,
+    skip_noop: bool = True,
+    out: Optional[torch.Tensor] = None,
+    out_dtype: Optional[torch.dtype] = None,
 ) -> Tuple[torch.Tensor, int]:
     """Apply sox effects to given Tensor
 
@@ -74,17 +529,63 @@ def apply_effects_tensor(
         only applies the given effects. (Therefore, to actually apply ``speed`` effect, you also
         need to give ``rate`` effect with desired sampling rate.).
 
+    Note:
+        When ``TORCHAUDIO_FAST_RATE=1`` is set, for ``float32`` input, ``rate`` effects of
+        the form ``["rate", "<sample rate>"]`` are performed with
+        :py:func:`torchaudio.functional.resample`, which is considerably faster than libsox.
+        The effects before and after it are still applied by libsox.
+        The result is close to, but not bit-exact with, that of libsox, and the number of
+        output frames can differ by one. ``rate`` effects following ``speed`` and the like,
+        and those between sample rates without a large common divisor, are always
+        performed by libsox.
+
+    Note:
+        libsox is run on the calling thread with the GIL released, so effects can be applied
+        concurrently from multiple threads. When ``TORCHAUDIO_SOX_WORKER=1`` is set, outside of
+        TorchScript, libsox is run on a background thread shared within the process instead,
+        which is started on first use, and the calling thread waits for the result.
+        The calls from all the threads of the process are then run one at a time on this thread,
+        except those from the threads of :py:func:`apply_effects_file_async`.
+
     Args:
         tensor (torch.Tensor): Input 2D CPU Tensor.
         sample_rate (int): Sample rate
-        effects (List[List[str]]): List of effects.
+        effects (List[List[str]] or EffectChain): List of effects, or :py:class:`EffectChain`
+            created from it.
         channels_first (bool, optional): Indicates if the input Tensor's dimension is
             `[channels, time]` or `[time, channels]`
+        parallel_channels (bool, optional): When ``True``, each channel is processed by its own
+            effects chain, and the chains are run in parallel on the intra-op thread pool.
+            This speeds up inputs with many channels, but is only valid for effects which
+            process channels independently. The effects must not change the number of channels
+            (such as ``remix`` or ``channels``), and effects which analyze all the channels
+            together (such as ``gain -n``) give different results. Default: ``False``.
+        skip_noop (bool, optional): When ``True`` and ``effects`` is empty or consists only of
+            effects that do not alter the data (``channels`` with the number of channels of the input,
+            and ``rate`` with the input sample rate), a copy of the input is returned without calling
+            libsox. Default: ``True``.
+
+            Note that passing ``float32`` data through libsox is not an exact round-trip:
+            values are clamped to ``[-1, 1]`` and quantized to multiples of ``2 ** -24``.
+            With ``skip_noop=True`` the input is returned as is instead, so out-of-range
+            or very small values are preserved. Set ``skip_noop=False`` to get the result
+            of libsox.
+        out (torch.Tensor or None, optional): Preallocated 2D CPU Tensor to write the result to,
+            so that a buffer can be reused across calls. It must have the same ``dtype`` and
+            channels order as the input Tensor, the number of channels of the result, and at least
+            as many frames as the result. The result is returned as the part of ``out``
+            that has been written. When given, all the effects are applied by libsox,
+            and ``parallel_channels`` and ``skip_noop`` are not used. Default: ``None``.
+        out_dtype (torch.dtype or None, optional): The ``dtype`` of the resulting Tensor,
+            such as ``torch.bfloat16`` for a model in reduced precision. The effects are still
+            computed at the precision of libsox, and only the result is converted with
+            :py:meth:`torch.Tensor.to`. Cannot be used with ``out``.
+            If ``None``, the ``dtype`` of the input Tensor is used. Default: ``None``.
 
     Returns:
         (Tensor, int): Resulting Tensor and sample rate.
-        The resulting Tensor has the same ``dtype`` as the input Tensor, and
-        the same channels order. The shape of the Tensor can be different based on the
+        The resulting Tensor has the same ``dtype`` as the input Tensor (unless ``out_dtype`` is given),
+        and the same channels order. The shape of the Tensor can be different based on the
         effects applied. Sample rate can also be different based on the effects applied.
 
     Example - Basic usage
@@ -155,7 +656,83 @@ def apply_effects_tensor(
         >>> waveform, sample_rate = transform(waveform, input_sample_rate)
         >>> assert sample_rate == 8000
     """
-    return sox_ext.apply_effects_tensor(tensor, sample_rate, effects, channels_first)
+    return _apply_effects_tensor(
+        tensor, sample_rate, effects, channels_first, parallel_channels, skip_noop, out, out_dtype
+    )
+
+
+@dropping_support
+def apply_effects_tensor_batch(
+    wave: torch.Tensor,
+    sample_rate: int,
+    effects: List[List[str]],
+    lengths: Optional[torch.Tensor] = None,
+    channels_first: bool = True,
+) -> Tuple[torch.Tensor, torch.Tensor, int]:
+    """Apply sox effects to each sample of a batch Tensor
+
+    .. devices:: CPU
+
+    .. properties:: TorchScript
+
+    The samples are processed in parallel on the intra-op thread pool of PyTorch
+    (see :py:func:`torch.set_num_threads`) with the GIL released. When all the effects
+    are filters that process each channel independently and keep the length
+    (such as ``lowpass``, ``equalizer`` and ``vol``), all the channels of the batch
+    are processed as one set of channels.
+
+    Args:
+        wave (torch.Tensor): Input 3D CPU Tensor with at least one sample.
+        sample_rate (int): Sample rate
+        effects (List[List[str]] or EffectChain): List of effects, or :py:class:`EffectChain`
+            created from it, applied to every sample.
+        lengths (torch.Tensor or None, optional): 1D Tensor with the number of valid frames
+            of each sample. The frames beyond them are ignored.
+            If ``None``, all the frames are used. Default: ``None``.
+        channels_first (bool, optional): Indicates if the input Tensor's dimension is
+            `[batch, channels, time]` or `[batch, time, channels]`
+
+    Returns:
+        (Tensor, Tensor, int): Resulting Tensor, the number of valid frames of each sample
+        in it, and sample rate. The resulting Tensor has the same ``dtype`` and dimension order
+        as the input Tensor, and the samples are padded with zeros to the longest one.
+
+    Example
+        >>> waveforms = torch.rand(8, 2, 16000) * 2 - 1
+        >>> lengths = torch.tensor([16000, 12000, 8000, 16000, 16000, 9000, 16000, 14000])
+        >>> effects = [["speed", "0.9"], ["rate", "16000"]]
+        >>> waveforms, lengths, sample_rate = apply_effects_tensor_batch(waveforms, 16000, effects, lengths)
+    """
+    if wave.dim() != 3:
+        raise RuntimeError("Input tensor has to be 3D.")
+    batch_size = wave.size(0)
+    if batch_size == 0:
+        # The sample rate and shape of the result are only known once the effects are applied.
+        raise RuntimeError("Input tensor has no sample.")
+    num_frames = wave.size(2 if channels_first else 1)
+    if lengths is None:
+        lengths = torch.full((batch_size,), num_frames, dtype=torch.int64)
+    if not torch.jit.is_scripting():
+        if lengths.dim() != 1 or lengths.size(0) != batch_size:
+            raise RuntimeError(f"Lengths tensor has to be 1D with the batch size ({batch_size}) elements.")
+        if lengths.min() < 0 or lengths.max() > num_frames:
+            raise RuntimeError(f"Lengths have to be between 0 and the number of frames ({num_frames}).")
+        effect_list = effects._effects if isinstance(effects, EffectChain) else effects
+        if _is_channelwise(effect_list):
+            # Process the batch as `[batch * channel, time]`, one effects chain per channel,
+            # then discard what the effects produced from the padding.
+            flat = wave if channels_first else wave.transpose(1, 2)
+            out, sample_rate = _sox_apply_effects_tensor(flat.reshape(-1, num_frames), sample_rate, effects, True, True)
+            out = out.reshape(batch_size, -1, num_frames)
+            mask = torch.arange(num_frames) >= lengths.to(torch.int64).unsqueeze(1)
+            out.masked_fill_(mask.unsqueeze(1), 0)
+            if not channels_first:
+                out = out.transpose(1, 2).contiguous()
+            return out, lengths.to(torch.int64), sample_rate
+        compiled = _get_compiled(effects)
+        func = sox_ext.apply_effects_tensor_batch_compiled
+        return _run_sox(func, wave, sample_rate, compiled, lengths, channels_first)
+    return sox_ext.apply_effects_tensor_batch(wave, sample_rate, effects, lengths, channels_first)
 
 
 @dropping_support
@@ -165,6 +742,7 @@ def apply_effects_file(
     normalize: bool = True,
     channels_first: bool = True,
     format: Optional[str] = None,
+    use_file_backend: Optional[bool] = None,
 ) -> Tuple[torch.Tensor, int]:
     """Apply sox effects to the audio file and load the resulting data as Tensor
 
@@ -180,10 +758,19 @@ def apply_effects_file(
         effect with desired sampling rate, because internally, ``speed`` effects only alter sampling
         rate and leave samples untouched.
 
+    Note:
+        Regular files of 1 MiB or larger are memory-mapped and decoded from memory. When
+        ``format`` is not given, the format of such files is taken from the file extension,
+        as libsox can not detect the format from the header of an in-memory stream.
+        If libsox can not open the file as that format, the file is read by path instead,
+        and the format is detected from the header. Provide ``format`` for files whose
+        extension does not match the content.
+
     Args:
         path (path-like object):
             Source of audio data.
-        effects (List[List[str]]): List of effects.
+        effects (List[List[str]] or EffectChain): List of effects, or :py:class:`EffectChain`
+            created from it.
         normalize (bool, optional):
             When ``True``, this function converts the native sample type to ``float32``.
             Default: ``True``.
@@ -198,6 +785,17 @@ def apply_effects_file(
             Override the format detection with the given format.
             Providing the argument might help when libsox can not infer the format
             from header or extension,
+        use_file_backend (bool or None, optional):
+            When ``True``, WAV and FLAC files are decoded with :py:func:`torchaudio.load`
+            using the FFmpeg or SoundFile backend, which is faster than decoding with libsox,
+            and the effects are applied with :py:func:`apply_effects_tensor`.
+            The result can differ slightly, as described in :py:func:`apply_effects_tensor`.
+            Other formats, the ``synth``, ``stat``, ``stats`` and ``spectrogram`` effects,
+            ``normalize=False`` (for which the backends return integer Tensors for FLAC),
+            and environments without either backend are still handled by libsox alone.
+            If ``None``, the ``TORCHAUDIO_SOX_FILE_BACKEND`` environment variable is used,
+            which defaults to ``False``.
+            This argument has no effect in TorchScript.
 
     Returns:
         (Tensor, int): Resulting Tensor and sample rate.
@@ -266,10 +864,247 @@ def apply_effects_file(
         >>>     pass
     """
     if not torch.jit.is_scripting():
-        if hasattr(path, "read"):
+        if __debug__ and hasattr(path, "read"):
             raise RuntimeError(
                 "apply_effects_file function does not support file-like object. "
                 "Please use torchaudio.io.AudioEffector."
             )
-        path = os.fspath(path)
+        if use_file_backend is None:
+            use_file_backend = _USE_FILE_BACKEND
+        # libsox decodes FLAC to float32 regardless of `normalize`, while the backends return
+        # integer Tensors, so the dtype would change.
+        if use_file_backend and normalize:
+            effect_list = effects._effects if isinstance(effects, EffectChain) else effects
+            backend = _get_file_backend(path, effect_list, format)
+            if backend is not None:
+                waveform, sample_rate = torchaudio.load(
+                    path, normalize=normalize, channels_first=channels_first, format=format, backend=backend
+                )
+                # Not through apply_effects_tensor, which would emit its own deprecation warning.
+                return _apply_effects_tensor(
+                    waveform,
+                    sample_rate,
+                    effects,
+                    channels_first,
+                    parallel_channels=False,
+                    skip_noop=True,
+                    out=None,
+                    out_dtype=None,
+                )
+        compiled = _get_compiled(effects)
+        # Large local files are memory-mapped and handed to libsox as an in-memory stream,
+        # so that the OS pages the data in lazily instead of libsox issuing read calls.
+        ret = _apply_effects_file_mmap(path, compiled, normalize, channels_first, format)
+        if ret is not None:
+            return ret
+        # The path-like object is converted to a path by the extension.
+        return sox_ext.apply_effects_path_obj(path, compiled, normalize, channels_first, format)
     return sox_ext.apply_effects_file(path, effects, normalize, channels_first, format)
+
+
+def _zip_results(tensors: List[torch.Tensor], sample_rates: List[int]) -> List[Tuple[torch.Tensor, int]]:
+    # Written as a loop, so that it can be compiled by TorchScript.
+    results: List[Tuple[torch.Tensor, int]] = []
+    for i in range(len(tensors)):
+        results.append((tensors[i], sample_rates[i]))
+    return results
+
+
+@dropping_support
+def apply_effects_files(
+    paths: List[str],
+    effects: List[List[str]],
+    normalize: bool = True,
+    channels_first: bool = True,
+    format: Optional[str] = None,
+) -> List[Tuple[torch.Tensor, int]]:
+    """Apply the same sox effects to multiple audio files and load the resulting data as Tensors
+
+    .. devices:: CPU
+
+    .. properties:: TorchScript
+
+    This function is equivalent to calling :py:func:`apply_effects_file` on each path,
+    but all the files are processed in a single call to the extension, so that the
+    per-call overhead is paid only once for the whole batch.
+
+    Args:
+        paths (List[path-like object]): Sources of audio data.
+        effects (List[List[str]]): List of effects, applied to every file.
+        normalize (bool, optional): See :py:func:`apply_effects_file`. Default: ``True``.
+        channels_first (bool, optional): See :py:func:`apply_effects_file`. Default: ``True``.
+        format (str or None, optional): Override the format detection with the given format.
+            The same format is used for all the files.
+
+    Returns:
+        List[Tuple[Tensor, int]]: Resulting Tensor and sample rate for each input file,
+        in the same order as ``paths``.
+
+    Example
+        >>> effects = [['gain', '-n'], ['rate', '8000']]
+        >>> results = apply_effects_files(["data1.wav", "data2.wav"], effects)
+        >>> waveform, sample_rate = results[0]
+    """
+    if not torch.jit.is_scripting():
+        paths = _fspaths(paths, "apply_effects_files")
+    tensors, sample_rates = sox_ext.apply_effects_files(paths, effects, normalize, channels_first, format)
+    return _zip_results(tensors, sample_rates)
+
+
+@dropping_support
+def apply_effects_files_parallel(
+    paths: List[str],
+    effects: List[List[str]],
+    num_threads: Optional[int] = None,
+    normalize: bool = True,
+    channels_first: bool = True,
+    format: Optional[str] = None,
+) -> List[Tuple[torch.Tensor, int]]:
+    """Apply the same sox effects to multiple audio files concurrently
+
+    .. devices:: CPU
+
+    .. properties:: TorchScript
+
+    Similar to :py:func:`apply_effects_files`, but the files are distributed over
+    the intra-op thread pool of PyTorch (see :py:func:`torch.set_num_threads`).
+    Each file is processed with its own effects chain, and the GIL is released
+    while the files are processed.
+
+    Note:
+        Effects that rely on the global PRNG of libsox (such as ``dither``)
+        do not produce reproducible results when run concurrently.
+
+    Args:
+        paths (List[path-like object]): Sources of audio data.
+        effects (List[List[str]]): List of effects, applied to every file.
+        num_threads (int or None, optional): The maximum number of threads used to
+            process the files. The intra-op thread pool size is the upper bound.
+            If ``None``, the size of the intra-op thread pool is used.
+        normalize (bool, optional): See :py:func:`apply_effects_file`. Default: ``True``.
+        channels_first (bool, optional): See :py:func:`apply_effects_file`. Default: ``True``.
+        format (str or None, optional): Override the format detection with the given format.
+            The same format is used for all the files.
+
+    Returns:
+        List[Tuple[Tensor, int]]: Resulting Tensor and sample rate for each input file,
+        in the same order as ``paths``.
+
+    Example
+        >>> effects = [['gain', '-n'], ['rate', '8000']]
+        >>> results = apply_effects_files_parallel(file_list, effects, num_threads=4)
+    """
+    if not torch.jit.is_scripting():
+        paths = _fspaths(paths, "apply_effects_files_parallel")
+    tensors, sample_rates = sox_ext.apply_effects_files_parallel(
+        paths, effects, normalize, channels_first, format, num_threads
+    )
+    return _zip_results(tensors, sample_rates)
+
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            max_workers = int(os.environ.get("TORCHAUDIO_SOX_THREADS", os.cpu_count() or 1))
+            # The pool threads call libsox directly, so that they are not serialized on the worker thread.
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="torchaudio_sox", initializer=_mark_inline_thread
+            )
+        return _EXECUTOR
+
+
+def _reset_executor():
+    # Worker threads do not survive fork (e.g. in DataLoader workers), so the child
+    # process creates its own executor on first use.
+    global _EXECUTOR, _EXECUTOR_LOCK
+    _EXECUTOR = None
+    _EXECUTOR_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executor)
+
+
+@dropping_support
+def apply_effects_file_async(
+    path: str,
+    effects: List[List[str]],
+    normalize: bool = True,
+    channels_first: bool = True,
+    format: Optional[str] = None,
+) -> "Future[Tuple[torch.Tensor, int]]":
+    """Apply sox effects to the audio file in a background thread
+
+    .. devices:: CPU
+
+    This function schedules :py:func:`apply_effects_file` on a thread pool shared
+    within the process, and returns immediately. The GIL is released while libsox
+    reads and processes the file, so the calling thread can keep working (for example,
+    preparing the next sample) in the meantime.
+
+    The number of threads is given by the ``TORCHAUDIO_SOX_THREADS`` environment variable,
+    which defaults to the number of CPUs. The pool is created on first use.
+
+    Args:
+        path (path-like object): Source of audio data.
+        effects (List[List[str]] or EffectChain): See :py:func:`apply_effects_file`.
+        normalize (bool, optional): See :py:func:`apply_effects_file`. Default: ``True``.
+        channels_first (bool, optional): See :py:func:`apply_effects_file`. Default: ``True``.
+        format (str or None, optional): See :py:func:`apply_effects_file`.
+
+    Returns:
+        concurrent.futures.Future: Future which resolves to the resulting Tensor
+        and sample rate. Errors raised by :py:func:`apply_effects_file` are re-raised
+        by :py:meth:`~concurrent.futures.Future.result`.
+
+    Example - Prefetch the next samples in a dataset
+        >>> class PrefetchDataset(torch.utils.data.Dataset):
+        ...     def __init__(self, flist, effects, lookahead=4):
+        ...         self.flist = flist
+        ...         self.effects = effects
+        ...         self.lookahead = lookahead
+        ...         self.futures = {}
+        ...
+        ...     def __getitem__(self, index):
+        ...         # Schedule the following samples, then wait for the current one.
+        ...         for i in range(index, min(index + self.lookahead, len(self.flist))):
+        ...             if i not in self.futures:
+        ...                 self.futures[i] = apply_effects_file_async(self.flist[i], self.effects)
+        ...         waveform, _ = self.futures.pop(index).result()
+        ...         return waveform
+        ...
+        ...     def __len__(self):
+        ...         return len(self.flist)
+        ...
+        >>> # Each DataLoader worker has its own thread pool. ``prefetch_factor`` controls how many
+        >>> # batches each worker prepares ahead, while the lookahead overlaps I/O within a worker.
+        >>> loader = torch.utils.data.DataLoader(dataset, batch_size=32, num_workers=4, prefetch_factor=2)
+    """
+    return _get_executor().submit(apply_effects_file, path, effects, normalize, channels_first, format)
+
+
+def _fspaths(paths, func_name: str) -> List[str]:
+    for path in paths:
+        if hasattr(path, "read"):
+            raise RuntimeError(
+                f"{func_name} function does not support file-like object. "
+                "Please use torchaudio.io.AudioEffector."
+            )
+    return [os.fspath(path) for path in paths]
+
+
+# When enabled, the public functions are bound without their deprecation wrapper,
+# so that calls in tight loops do not go through the warning machinery and an extra frame.
+if eval_env("TORCHAUDIO_SUPPRESS_DEPRECATION", False):
+    effect_names = effect_names.__wrapped__
+    apply_effects_tensor = apply_effects_tensor.__wrapped__
+    apply_effects_tensor_batch = apply_effects_tensor_batch.__wrapped__
+    apply_effects_file = apply_effects_file.__wrapped__
+    apply_effects_files = apply_effects_files.__wrapped__
+    apply_effects_files_parallel = apply_effects_files_parallel.__wrapped__
+    apply_effects_file_async = apply_effects_file_async.__wrapped__
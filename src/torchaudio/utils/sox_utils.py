@@ -64,6 +64,23 @@ def set_buffer_size(buffer_size: int):
     sox_ext.set_buffer_size(buffer_size)
 
 
+@dropping_support
+def prime_fft_cache(max_len: int = 65536):
+    """Allocate libsox's FFT cache for DFTs of up to the given length
+
+    libsox shares one FFT cache among all the effects chains, and grows it when an effect
+    (such as ``rate`` or ``sinc``) needs a longer DFT than before. libsox only takes a lock
+    for this when it is built with OpenMP; otherwise growing the cache while effects are
+    applied concurrently is a data race. Growing the cache up-front avoids it.
+    The cache is allocated for ``65536`` points when libsox is initialized.
+
+    Args:
+        max_len (int): The number of points of the longest DFT. Must be a power of two
+            no greater than ``131072``, the longest DFT used by the filters of libsox.
+    """
+    sox_ext.prime_fft_cache(max_len)
+
+
 @dropping_support
 def set_use_threads(use_threads: bool):
     """Set multithread option for sox effect chain
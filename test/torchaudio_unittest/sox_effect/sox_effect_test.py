@@ -1,6 +1,14 @@
 import itertools
+import os
+import pickle
+import subprocess
+import sys
 from pathlib import Path
+from unittest.mock import patch
 
+import torch
+import torchaudio
+import torchaudio.functional as F
 from parameterized import parameterized
 from torchaudio import sox_effects
 from torchaudio_unittest.common_utils import (
@@ -24,6 +32,25 @@ class TestSoxEffects(PytorchTestCase):
         for _ in range(3):
             sox_effects.init_sox_effects()
 
+    def test_suppress_deprecation(self):
+        """TORCHAUDIO_SUPPRESS_DEPRECATION=1 binds the functions without the deprecation wrapper"""
+        code = (
+            "import warnings, torch;"
+            "from torchaudio import sox_effects;"
+            "assert not hasattr(sox_effects.apply_effects_tensor, '__wrapped__');"
+            "warnings.simplefilter('error');"
+            "sox_effects.apply_effects_tensor(torch.zeros(1, 100), 8000, [['reverse']])"
+        )
+        env = dict(os.environ, TORCHAUDIO_SUPPRESS_DEPRECATION="1")
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+    def test_effect_names(self):
+        """effect_names returns the effects of libsox, and the result can be modified by the caller"""
+        names = sox_effects.effect_names()
+        assert names == list(torchaudio.utils.sox_utils.list_effects().keys())
+        names.clear()
+        assert sox_effects.effect_names() == list(torchaudio.utils.sox_utils.list_effects().keys())
+
 
 @skipIfNoSox
 class TestSoxEffectsTensor(TempDirMixin, PytorchTestCase):
@@ -47,10 +74,52 @@ class TestSoxEffectsTensor(TempDirMixin, PytorchTestCase):
         # Returned Tensor should equal to the input Tensor
         self.assertEqual(expected, found)
 
+    @parameterized.expand(
+        list(itertools.product([[], [["rate", "8000"]], [["channels", "2"], ["rate", "8000"]]], [True, False])),
+        name_func=lambda f, i, p: f"{f.__name__}_{i}",
+    )
+    def test_apply_noop_effects(self, effects, skip_noop):
+        """Effects which do not alter the data return a copy of the input, with or without libsox"""
+        original = get_wav_data("int16", 2, channels_first=False).t()
+        with patch.object(
+            sox_effects.sox_effects.sox_ext,
+            "apply_effects_tensor_compiled",
+            wraps=sox_effects.sox_effects.sox_ext.apply_effects_tensor_compiled,
+        ) as mocked:
+            found, sr = sox_effects.apply_effects_tensor(original, 8000, effects, skip_noop=skip_noop)
+            assert mocked.called != skip_noop
+
+        assert sr == 8000
+        assert found is not original
+        assert found.is_contiguous()
+        self.assertEqual(found, original)
+
+    def test_apply_noop_effects_out_of_range(self):
+        """Skipping libsox preserves float32 values which libsox would clamp"""
+        original = torch.tensor([[-2.0, -0.5, 0.0, 0.5, 2.0], [1e-9, 0.25, 1.5, -1.5, 0.0]])
+
+        found, sr = sox_effects.apply_effects_tensor(original, 8000, [], skip_noop=True)
+        assert sr == 8000
+        self.assertEqual(found, original)
+
+        found, sr = sox_effects.apply_effects_tensor(original, 8000, [], skip_noop=False)
+        assert sr == 8000
+        assert found.abs().max() <= 1
+        self.assertEqual(found, original.clamp(-1, 1), atol=1e-6, rtol=0)
+
+    def test_apply_effects_not_noop(self):
+        """`rate` and `channels` effects that alter the data are not skipped"""
+        original = get_wav_data("int16", 2)
+        found, sr = sox_effects.apply_effects_tensor(original, 8000, [["rate", "4000"]])
+        assert sr == 4000
+        found, sr = sox_effects.apply_effects_tensor(original, 8000, [["channels", "1"]])
+        assert found.size(0) == 1
+
     @parameterized.expand(
         load_params("sox_effect_test_args.jsonl"),
         name_func=lambda f, i, p: f'{f.__name__}_{i}_{p.args[0]["effects"][0][0]}',
     )
+    @patch.object(sox_effects.sox_effects, "_USE_FAST_RATE", False)
     def test_apply_effects(self, args):
         """`apply_effects_tensor` should return identical data as sox command"""
         effects = args["effects"]
@@ -71,6 +140,415 @@ class TestSoxEffectsTensor(TempDirMixin, PytorchTestCase):
         assert sr == expected_sr
         self.assertEqual(expected, found)
 
+    @parameterized.expand(
+        [
+            ([["rate", "4000"]],),
+            ([["gain", "-3"], ["rate", "4000"]],),
+            ([["reverse"], ["rate", "11025"], ["gain", "-3"]],),
+            ([["rate", "16000"], ["lowpass", "1000"], ["rate", "4000"]],),
+        ]
+    )
+    @patch.object(sox_effects.sox_effects, "_USE_FAST_RATE", True)
+    def test_apply_effects_fast_rate(self, effects):
+        """`rate` effects are replaced with `torchaudio.functional.resample`"""
+        original = get_sinusoid(frequency=800, sample_rate=8000, n_channels=2, dtype="float32")
+
+        found, sr = sox_effects.apply_effects_tensor(original, 8000, effects)
+
+        # Apply the same effects manually
+        expected, expected_sr = original, 8000
+        for effect in effects:
+            if effect[0] == "rate":
+                new_sr = int(effect[1])
+                expected = F.resample(expected, expected_sr, new_sr)
+                expected_sr = new_sr
+            else:
+                expected, expected_sr = torch.ops.torchaudio_sox.apply_effects_tensor(
+                    expected, expected_sr, [effect], True
+                )
+        assert sr == expected_sr
+        self.assertEqual(found, expected)
+
+        # The result is close to that of libsox
+        with patch.object(sox_effects.sox_effects, "_USE_FAST_RATE", False):
+            reference, reference_sr = sox_effects.apply_effects_tensor(original, 8000, effects)
+        assert sr == reference_sr
+        assert abs(found.size(1) - reference.size(1)) <= 1
+
+    @parameterized.expand([(True,), (False,)])
+    @patch.object(sox_effects.sox_effects, "_USE_FAST_RATE", True)
+    def test_fast_rate_same_rate(self, channels_first):
+        """`rate` to the same sample rate does not return a view of the input"""
+        original = get_wav_data("float32", 2, channels_first=channels_first)
+
+        found, sr = sox_effects.apply_effects_tensor(
+            original, 8000, [["rate", "8000"]], channels_first, skip_noop=False
+        )
+
+        assert sr == 8000
+        assert found.data_ptr() != original.data_ptr()
+        assert found.is_contiguous()
+        self.assertEqual(found, original)
+
+    @patch.object(sox_effects.sox_effects, "_USE_FAST_RATE", True)
+    def test_fast_rate_kernel_cache(self):
+        """Resampling kernels are built once per pair of sample rates"""
+        get_kernel = sox_effects.sox_effects._get_resample_kernel
+        get_kernel.cache_clear()
+        original = get_sinusoid(frequency=800, sample_rate=8000, n_channels=2, dtype="float32")
+
+        for _ in range(3):
+            found, sr = sox_effects.apply_effects_tensor(original, 8000, [["rate", "11025"]])
+
+        info = get_kernel.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+        assert sr == 11025
+        self.assertEqual(found, F.resample(original, 8000, 11025))
+
+        # 16000 -> 22050 reduces to the same pair as 8000 -> 11025
+        original = get_sinusoid(frequency=800, sample_rate=16000, n_channels=2, dtype="float32")
+        found, sr = sox_effects.apply_effects_tensor(original, 16000, [["rate", "22050"]])
+        info = get_kernel.cache_info()
+        assert info.misses == 1
+        assert info.hits == 3
+        self.assertEqual(found, F.resample(original, 16000, 22050))
+
+    @parameterized.expand(
+        [
+            ([["speed", "1.03756"], ["rate", "16000"]],),
+            ([["rate", "16001"]],),
+        ]
+    )
+    @patch.object(sox_effects.sox_effects, "_USE_FAST_RATE", True)
+    def test_fast_rate_fallback(self, effects):
+        """`rate` effects which are not safe to replace are applied by libsox"""
+        get_kernel = sox_effects.sox_effects._get_resample_kernel
+        get_kernel.cache_clear()
+        original = get_sinusoid(frequency=800, sample_rate=16000, n_channels=2, dtype="float32")
+
+        found, sr = sox_effects.apply_effects_tensor(original, 16000, effects)
+        expected, expected_sr = torch.ops.torchaudio_sox.apply_effects_tensor(original, 16000, effects, True)
+        assert sr == expected_sr
+        self.assertEqual(found, expected)
+        assert get_kernel.cache_info().misses == 0
+
+    def test_split_rate(self):
+        """Only the plain form of `rate` effect with a known input rate is extracted"""
+        split_rate = sox_effects.sox_effects._split_rate
+        assert split_rate([["gain", "-n"], ["rate", "8000"], ["trim", "0", "1"]], 16000) == (
+            [["gain", "-n"]],
+            8000,
+            [["trim", "0", "1"]],
+        )
+        assert split_rate([["rate", "-v", "8000"]], 16000) == ([["rate", "-v", "8000"]], None, [])
+        assert split_rate([["rate", "8k"]], 16000) == ([["rate", "8k"]], None, [])
+        # The rate after `speed` is not known exactly
+        assert split_rate([["speed", "1.1"], ["rate", "8000"]], 16000) == (
+            [["speed", "1.1"], ["rate", "8000"]],
+            None,
+            [],
+        )
+        # Once a `rate` is applied by libsox, the following rate is known again
+        assert split_rate([["speed", "1.1"], ["rate", "8000"], ["rate", "16000"]], 16000) == (
+            [["speed", "1.1"], ["rate", "8000"]],
+            16000,
+            [],
+        )
+        # Coprime sample rates
+        assert split_rate([["rate", "16001"]], 16000) == ([["rate", "16001"]], None, [])
+        # Invalid rate is left to libsox
+        assert split_rate([["rate", "0"]], 16000) == ([["rate", "0"]], None, [])
+
+    @parameterized.expand(
+        list(itertools.product(["float32", "int16"], [1, 8], [True, False])),
+        name_func=name_func,
+    )
+    def test_apply_effects_parallel_channels(self, dtype, num_channels, channels_first):
+        """`parallel_channels=True` gives the same result for channel-wise effects"""
+        effects = [["lowpass", "-1", "300"], ["vol", "0.5"], ["pad", "0.1"]]
+        original = get_wav_data(dtype, num_channels, channels_first=channels_first)
+
+        expected, expected_sr = sox_effects.apply_effects_tensor(original, 8000, effects, channels_first)
+        found, sr = sox_effects.apply_effects_tensor(
+            original, 8000, effects, channels_first, parallel_channels=True
+        )
+
+        assert sr == expected_sr
+        self.assertEqual(found, expected)
+
+    def test_apply_effects_parallel_channels_compand(self):
+        """`parallel_channels=True` works with effects which tokenize their options in place"""
+        effects = [["compand", "0.3,1", "6:-70,-60,-20", "-5", "-90", "0.2"]]
+        original = torch.cat(
+            [get_sinusoid(frequency=200 * (c + 1), sample_rate=8000, n_channels=1, dtype="float32") for c in range(8)]
+        )
+
+        expected = [sox_effects.apply_effects_tensor(original[c : c + 1], 8000, effects) for c in range(8)]
+        for _ in range(2):
+            found, sr = sox_effects.apply_effects_tensor(original, 8000, effects, parallel_channels=True)
+            assert sr == expected[0][1]
+            self.assertEqual(found, torch.cat([e for e, _ in expected]))
+
+    def test_apply_effects_parallel_channels_remix(self):
+        """`parallel_channels=True` rejects effects which change the number of channels"""
+        original = get_wav_data("float32", 2)
+        with self.assertRaisesRegex(RuntimeError, "number of channels"):
+            sox_effects.apply_effects_tensor(original, 8000, [["channels", "2"]], parallel_channels=True)
+
+    @parameterized.expand(
+        list(itertools.product(["float32", "int32", "int16", "uint8"], [True, False])),
+        name_func=name_func,
+    )
+    def test_apply_effects_non_contiguous(self, dtype, channels_first):
+        """Non-contiguous input gives the same result as contiguous input"""
+        effects = [["lowpass", "-1", "300"], ["reverse"]]
+        # Input Tensor in the opposite memory layout of what `channels_first` indicates.
+        original = get_wav_data(dtype, 4, channels_first=not channels_first).t()
+        assert not original.is_contiguous()
+
+        found, sr = sox_effects.apply_effects_tensor(original, 8000, effects, channels_first)
+        expected, expected_sr = sox_effects.apply_effects_tensor(original.contiguous(), 8000, effects, channels_first)
+
+        assert sr == expected_sr
+        self.assertEqual(found, expected)
+
+    @parameterized.expand(
+        [
+            (torch.zeros(2, 100, dtype=torch.float16), "float32, int32, int16 or uint8"),
+            (torch.zeros(2, 100, dtype=torch.float64), "float32, int32, int16 or uint8"),
+            (torch.zeros(100), "2D"),
+        ]
+    )
+    def test_apply_effects_invalid_input(self, tensor, message):
+        """Invalid input Tensors are rejected"""
+        with self.assertRaisesRegex(RuntimeError, message):
+            sox_effects.apply_effects_tensor(tensor, 8000, [["reverse"]])
+
+    @parameterized.expand(
+        list(itertools.product(["float32", "int32", "int16", "uint8"], [True, False])),
+        name_func=name_func,
+    )
+    def test_apply_effects_out(self, dtype, channels_first):
+        """Writing to `out` gives the same result as the allocating path"""
+        effects = [["lowpass", "-1", "300"], ["trim", "0", "0.5"]]
+        original = get_wav_data(dtype, 2, num_frames=8000, channels_first=channels_first)
+        shape = [2, 8000] if channels_first else [8000, 2]
+        out = torch.empty(shape, dtype=original.dtype)
+
+        expected, expected_sr = sox_effects.apply_effects_tensor(original, 8000, effects, channels_first)
+        found, sr = sox_effects.apply_effects_tensor(original, 8000, effects, channels_first, out=out)
+
+        assert sr == expected_sr
+        assert found.data_ptr() == out.data_ptr()
+        self.assertEqual(found, expected)
+
+    @parameterized.expand(
+        [
+            (torch.empty(2, 3999), "too small"),
+            (torch.empty(1, 8000), "2 channels"),
+            (torch.empty(2, 8000, dtype=torch.int16), "same dtype"),
+        ]
+    )
+    def test_apply_effects_out_invalid(self, out, message):
+        """Output Tensors which cannot hold the result are rejected"""
+        original = get_wav_data("float32", 2, num_frames=8000)
+        with self.assertRaisesRegex(RuntimeError, message):
+            sox_effects.apply_effects_tensor(original, 8000, [["trim", "0", "0.5"]], out=out)
+
+    @parameterized.expand(
+        list(
+            itertools.product(
+                [[["lowpass", "-1", "300"], ["vol", "0.5"]], [["reverse"], ["pad", "0", "0.1"]]],
+                [True, False],
+            )
+        ),
+        name_func=name_func,
+    )
+    def test_apply_effects_tensor_batch(self, effects, channels_first):
+        """`apply_effects_tensor_batch` gives the same result as applying the effects to each sample"""
+        lengths = torch.tensor([8000, 6000, 0, 7999])
+        samples = [get_wav_data("float32", 2, num_frames=8000, normalize=True) * (i + 1) / 8 for i in range(4)]
+        wave = torch.stack(samples)
+        if not channels_first:
+            wave = wave.transpose(1, 2)
+        time_dim = 2 if channels_first else 1
+
+        found, found_lengths, sr = sox_effects.apply_effects_tensor_batch(wave, 8000, effects, lengths, channels_first)
+
+        assert found.size(0) == 4
+        assert found.size(time_dim) == found_lengths.max()
+        for i in range(4):
+            sample = wave[i].narrow(time_dim - 1, 0, int(lengths[i]))
+            expected, expected_sr = sox_effects.apply_effects_tensor(sample, 8000, effects, channels_first)
+            assert sr == expected_sr
+            assert found_lengths[i] == expected.size(time_dim - 1)
+            self.assertEqual(found[i].narrow(time_dim - 1, 0, int(found_lengths[i])), expected)
+            padding = found[i].narrow(time_dim - 1, int(found_lengths[i]), found.size(time_dim) - int(found_lengths[i]))
+            assert (padding == 0).all()
+
+    def test_apply_effects_tensor_batch_compand(self):
+        """`apply_effects_tensor_batch` works with effects which tokenize their options in place"""
+        effects = [["compand", "0.3,1", "6:-70,-60,-20", "-5", "-90", "0.2"]]
+        wave = torch.stack(
+            [get_sinusoid(frequency=200 * (i + 1), sample_rate=8000, n_channels=2, dtype="float32") for i in range(8)]
+        )
+
+        expected = [sox_effects.apply_effects_tensor(wave[i], 8000, effects)[0] for i in range(8)]
+        for _ in range(2):
+            found, lengths, sr = sox_effects.apply_effects_tensor_batch(wave, 8000, effects)
+            assert sr == 8000
+            assert (lengths == wave.size(2)).all()
+            self.assertEqual(found, torch.stack(expected))
+
+    @parameterized.expand([([["reverse"]],), ([["lowpass", "-1", "300"]],)])
+    def test_apply_effects_tensor_batch_empty(self, effects):
+        """`apply_effects_tensor_batch` rejects an empty batch"""
+        with self.assertRaisesRegex(RuntimeError, "no sample"):
+            sox_effects.apply_effects_tensor_batch(torch.zeros(0, 2, 100), 8000, effects)
+
+    def test_apply_effects_tensor_batch_invalid_lengths(self):
+        """`apply_effects_tensor_batch` rejects lengths beyond the number of frames"""
+        wave = torch.zeros(2, 1, 100)
+        with self.assertRaisesRegex(RuntimeError, "between 0 and the number of frames"):
+            sox_effects.apply_effects_tensor_batch(wave, 8000, [["reverse"]], torch.tensor([100, 101]))
+
+    @parameterized.expand(
+        [
+            ([["lowpass", "-1", "300"], ["rate", "4000"]],),
+            ([["channels", "2"]],),
+        ]
+    )
+    def test_apply_effects_out_dtype(self, effects):
+        """`out_dtype` converts the result"""
+        original = get_wav_data("float32", 2, num_frames=8000)
+
+        expected, expected_sr = sox_effects.apply_effects_tensor(original, 8000, effects)
+        found, sr = sox_effects.apply_effects_tensor(original, 8000, effects, out_dtype=torch.bfloat16)
+
+        assert sr == expected_sr
+        assert found.dtype == torch.bfloat16
+        self.assertEqual(found, expected.to(torch.bfloat16))
+        with self.assertRaises(ValueError):
+            sox_effects.apply_effects_tensor(
+                original, 8000, effects, out=torch.empty_like(original), out_dtype=torch.bfloat16
+            )
+
+    def test_apply_effects_worker(self):
+        """Effects run on the opt-in worker thread give the same result as effects run inline"""
+        effects = [["lowpass", "-1", "300"], ["reverse"]]
+        original = get_sinusoid(frequency=800, sample_rate=8000, n_channels=2, dtype="float32")
+
+        with patch.object(sox_effects.sox_effects._SoxWorker, "submit", side_effect=AssertionError("worker used")):
+            # The worker is not used by default
+            expected, expected_sr = sox_effects.apply_effects_tensor(original, 8000, effects)
+        with patch.object(sox_effects.sox_effects, "_USE_SOX_WORKER", True):
+            found, sr = sox_effects.apply_effects_tensor(original, 8000, effects)
+            worker = sox_effects.sox_effects._SoxWorker._instance
+            assert worker is not None and worker.is_alive()
+            with self.assertRaisesRegex(RuntimeError, "number of channels"):
+                sox_effects.apply_effects_tensor(original, 8000, [["channels", "1"]], parallel_channels=True)
+            # The worker keeps running after an error
+            sox_effects.apply_effects_tensor(original, 8000, effects)
+            assert sox_effects.sox_effects._SoxWorker._instance is worker
+
+        assert sr == expected_sr
+        self.assertEqual(found, expected)
+
+    def test_apply_effects_executor_inline(self):
+        """The thread pool of `apply_effects_file_async` calls libsox without the worker thread"""
+        module = sox_effects.sox_effects
+        original = get_sinusoid(frequency=800, sample_rate=8000, n_channels=2, dtype="float32")
+
+        def apply():
+            with patch.object(module._SoxWorker, "submit", side_effect=AssertionError("worker used")):
+                return module.apply_effects_tensor(original, 8000, [["reverse"]])
+
+        with patch.object(module, "_USE_SOX_WORKER", True):
+            found, sr = module._get_executor().submit(apply).result()
+        assert sr == 8000
+        self.assertEqual(found, original.flip(1))
+
+    def test_compiled_effects_cache(self):
+        """Equal effects descriptions are compiled once and give the same result as the uncompiled op"""
+        original = get_sinusoid(frequency=800, sample_rate=8000, n_channels=2, dtype="float32")
+        sox_effects.sox_effects._compile_effects.cache_clear()
+
+        results = []
+        for _ in range(3):
+            effects = [["lowpass", "-1", "300"], ["reverse"]]
+            results.append(sox_effects.apply_effects_tensor(original, 8000, effects))
+
+        info = sox_effects.sox_effects._compile_effects.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+        expected, expected_sr = torch.ops.torchaudio_sox.apply_effects_tensor(original, 8000, effects, True)
+        for found, sr in results:
+            assert sr == expected_sr
+            self.assertEqual(expected, found)
+
+    @parameterized.expand(
+        [
+            ([["lowpass", "-1", "300"], ["reverse"]],),
+            ([["lowpass", "-1", "300"], ["rate", "4000"], ["vol", "0.5"]],),
+            ([["channels", "2"]],),
+        ]
+    )
+    def test_effect_chain(self, effects):
+        """EffectChain gives the same result as the list of effects"""
+        original = get_sinusoid(frequency=800, sample_rate=8000, n_channels=2, dtype="float32")
+        chain = sox_effects.EffectChain(effects)
+        assert chain.effects == effects
+
+        expected, expected_sr = sox_effects.apply_effects_tensor(original, 8000, effects)
+        found, sr = sox_effects.apply_effects_tensor(original, 8000, chain)
+
+        assert sr == expected_sr
+        self.assertEqual(found, expected)
+
+    def test_effect_chain_pickle(self):
+        """EffectChain can be pickled, for example to be sent to DataLoader workers"""
+        effects = [["lowpass", "-1", "300"], ["rate", "4000"], ["vol", "0.5"]]
+        original = get_sinusoid(frequency=800, sample_rate=8000, n_channels=2, dtype="float32")
+        chain = pickle.loads(pickle.dumps(sox_effects.EffectChain(effects)))
+        assert chain.effects == effects
+
+        expected, expected_sr = sox_effects.apply_effects_tensor(original, 8000, effects)
+        found, sr = sox_effects.apply_effects_tensor(original, 8000, chain)
+
+        assert sr == expected_sr
+        self.assertEqual(found, expected)
+
+    def test_effect_chain_invalid(self):
+        """EffectChain rejects unsupported effects when it is created"""
+        with self.assertRaisesRegex(RuntimeError, "Unsupported effect"):
+            sox_effects.EffectChain([["foo"]])
+
+    @parameterized.expand(
+        [
+            ([["compand", "0.3,1", "6:-70,-60,-20", "-5", "-90", "0.2"]], 8000),
+            ([["mcompand", "0.005,0.1 -47,-40,-34,-34,-17,-33", "100", "0,0.025 -38,-31,-28,-28,-0,-25"]], 44100),
+        ]
+    )
+    def test_compiled_effects_reuse(self, effects, sample_rate):
+        """Effects which tokenize their options in place give the same result when applied again"""
+        input_path = self.get_temp_path("input.wav")
+        reference_path = self.get_temp_path("reference.wav")
+        original = get_sinusoid(frequency=800, sample_rate=sample_rate, n_channels=2, dtype="float32")
+        save_wav(input_path, original, sample_rate)
+        sox_utils.run_sox_effect(input_path, reference_path, effects)
+        expected, expected_sr = load_wav(reference_path)
+
+        for _ in range(2):
+            found, sr = sox_effects.apply_effects_tensor(original, sample_rate, effects)
+            assert sr == expected_sr
+            self.assertEqual(expected, found)
+
+    def test_compiled_effects_invalid(self):
+        """Unsupported effects are rejected when compiled"""
+        with self.assertRaisesRegex(RuntimeError, "Unsupported effect"):
+            sox_effects.apply_effects_tensor(torch.zeros(1, 8000), 8000, [["foo"]])
+
 
 @skipIfNoSox
 class TestSoxEffectsFile(TempDirMixin, PytorchTestCase):
@@ -125,6 +603,22 @@ class TestSoxEffectsFile(TempDirMixin, PytorchTestCase):
         assert sr == expected_sr
         self.assertEqual(found, expected)
 
+    def test_apply_effects_normalize_int32(self):
+        """Normalization of 32-bit samples rounds and saturates the same way as libsox"""
+        int32_max = 2**31 - 1
+        values = [-(2**31), -(2**31) + 64, -129, -64, -1, 0, 63, 64, 127, 128]
+        values += [int32_max - 64, int32_max - 63, int32_max]
+        data = torch.tensor([values, values[::-1]], dtype=torch.int32)
+        path = self.get_temp_path("input.wav")
+        save_wav(path, data, 8000)
+
+        found, _ = sox_effects.apply_effects_file(path, [], normalize=True)
+
+        # SOX_SAMPLE_TO_FLOAT_32BIT
+        rounded = ((data.to(torch.int64) + 64) & ~127).to(torch.float64) / 2**31
+        expected = torch.where(data > int32_max - 64, 1.0, rounded).to(torch.float32)
+        self.assertEqual(found, expected, atol=0, rtol=0)
+
     def test_apply_effects_path(self):
         """`apply_effects_file` should return identical data as sox command when file path is given as a Path Object"""
         dtype = "int32"
@@ -148,6 +642,169 @@ class TestSoxEffectsFile(TempDirMixin, PytorchTestCase):
         assert sr == expected_sr
         self.assertEqual(found, expected)
 
+    def test_apply_effects_file_backend(self):
+        """`use_file_backend=True` decodes with torchaudio.load and gives the same result as libsox"""
+        if not {"ffmpeg", "soundfile"} & set(torchaudio._backend.utils.get_available_backends()):
+            self.skipTest("Neither FFmpeg nor SoundFile backend is available.")
+        input_path = self.get_temp_path("input.wav")
+        save_wav(input_path, get_wav_data("int16", 2), 8000)
+        effects = [["lowpass", "-1", "300"], ["reverse"]]
+
+        expected, expected_sr = sox_effects.apply_effects_file(input_path, effects, use_file_backend=False)
+        with patch("torchaudio.load", wraps=torchaudio.load) as load:
+            found, sr = sox_effects.apply_effects_file(input_path, effects, use_file_backend=True)
+            load.assert_called_once()
+            # The internal helper is called, so the deprecation warning is not emitted twice
+            with patch.object(sox_effects.sox_effects, "apply_effects_tensor", side_effect=AssertionError):
+                sox_effects.apply_effects_file(input_path, effects, use_file_backend=True)
+            # Effects which generate audio are left to libsox
+            sox_effects.apply_effects_file(input_path, [["synth", "0.1", "sine", "440"]], use_file_backend=True)
+            assert load.call_count == 2
+
+        assert sr == expected_sr
+        self.assertEqual(found, expected)
+
+    def test_apply_effects_file_backend_flac_no_normalize(self):
+        """`use_file_backend=True` keeps the dtype of libsox for FLAC with `normalize=False`"""
+        if not {"ffmpeg", "soundfile"} & set(torchaudio._backend.utils.get_available_backends()):
+            self.skipTest("Neither FFmpeg nor SoundFile backend is available.")
+        input_path = self.get_temp_path("input.flac")
+        sox_utils.gen_audio_file(input_path, 8000, 2)
+        effects = [["lowpass", "-1", "300"], ["reverse"]]
+
+        expected, expected_sr = sox_effects.apply_effects_file(
+            input_path, effects, normalize=False, use_file_backend=False
+        )
+        found, sr = sox_effects.apply_effects_file(input_path, effects, normalize=False, use_file_backend=True)
+
+        assert expected.dtype == torch.float32
+        assert found.dtype == expected.dtype
+        assert sr == expected_sr
+        self.assertEqual(found, expected)
+
+    def test_apply_effects_effect_chain(self):
+        """`apply_effects_file` accepts EffectChain"""
+        input_path = self.get_temp_path("input.wav")
+        save_wav(input_path, get_wav_data("int16", 2), 8000)
+        effects = [["lowpass", "-1", "300"], ["reverse"]]
+
+        expected, expected_sr = sox_effects.apply_effects_file(input_path, effects)
+        found, sr = sox_effects.apply_effects_file(input_path, sox_effects.EffectChain(effects))
+
+        assert sr == expected_sr
+        self.assertEqual(found, expected)
+
+    def test_apply_effects_path_types(self):
+        """`apply_effects_file` accepts str, bytes and Path and rejects other types"""
+        input_path = self.get_temp_path("input.wav")
+        save_wav(input_path, get_wav_data("float32", 2), 8000)
+        effects = [["reverse"]]
+
+        expected, expected_sr = sox_effects.apply_effects_file(input_path, effects)
+        for path in [os.fsencode(input_path), Path(input_path)]:
+            found, sr = sox_effects.apply_effects_file(path, effects)
+            assert sr == expected_sr
+            self.assertEqual(found, expected)
+
+        with self.assertRaises(TypeError):
+            sox_effects.apply_effects_file(None, effects)
+
+    @parameterized.expand([("wav",), ("flac",)])
+    def test_apply_effects_mmap(self, ext):
+        """Memory-mapped files give the same result as files read by libsox"""
+        effects = [["lowpass", "1000"], ["gain", "-3"]]
+        input_path = self.get_temp_path(f"input.{ext}")
+        if ext == "wav":
+            save_wav(input_path, get_wav_data("int16", 2), 16000)
+        else:
+            sox_utils.gen_audio_file(input_path, 16000, 2)
+
+        with patch.object(sox_effects.sox_effects, "_MMAP_THRESHOLD", float("inf")):
+            expected, expected_sr = sox_effects.apply_effects_file(input_path, effects)
+        with patch.object(sox_effects.sox_effects, "_MMAP_THRESHOLD", 0), patch.object(
+            sox_effects.sox_effects.sox_ext,
+            "apply_effects_memory",
+            wraps=sox_effects.sox_effects.sox_ext.apply_effects_memory,
+        ) as mocked:
+            found, sr = sox_effects.apply_effects_file(input_path, effects)
+            mocked.assert_called_once()
+
+        assert sr == expected_sr
+        self.assertEqual(found, expected)
+
+    def test_apply_effects_file_async(self):
+        """`apply_effects_file_async` should resolve to the same result as `apply_effects_file`"""
+        effects = [["lowpass", "1000"], ["rate", "4000"]]
+        paths = []
+        for i in range(4):
+            path = self.get_temp_path(f"input_{i}.wav")
+            save_wav(path, get_wav_data("int16", 2), 8000)
+            paths.append(path)
+
+        futures = [sox_effects.apply_effects_file_async(path, effects) for path in paths]
+        for path, future in zip(paths, futures):
+            found, sr = future.result()
+            expected, expected_sr = sox_effects.apply_effects_file(path, effects)
+            assert sr == expected_sr
+            self.assertEqual(found, expected)
+
+        future = sox_effects.apply_effects_file_async(self.get_temp_path("missing.wav"), effects)
+        with self.assertRaises(RuntimeError):
+            future.result()
+
+    def test_apply_effects_files(self):
+        """`apply_effects_files` should return the same result as `apply_effects_file` on each file"""
+        effects = [["gain", "-n"], ["rate", "4000"]]
+        paths = []
+        for i, (dtype, sample_rate) in enumerate(itertools.product(["float32", "int16"], [8000, 16000])):
+            path = self.get_temp_path(f"input_{i}.wav")
+            save_wav(path, get_wav_data(dtype, 2), sample_rate)
+            paths.append(path)
+
+        results = sox_effects.apply_effects_files(paths, effects)
+
+        assert len(results) == len(paths)
+        for path, (found, sr) in zip(paths, results):
+            expected, expected_sr = sox_effects.apply_effects_file(path, effects)
+            assert sr == expected_sr
+            self.assertEqual(found, expected)
+
+    @parameterized.expand([(None,), (1,), (3,)])
+    def test_apply_effects_files_parallel(self, num_threads):
+        """`apply_effects_files_parallel` should return the same result as `apply_effects_files`"""
+        effects = [["lowpass", "1000"], ["rate", "4000"]]
+        paths = []
+        for i in range(8):
+            path = self.get_temp_path(f"input_{i}.wav")
+            save_wav(path, get_wav_data("int16", 2), 8000 * (1 + i % 2))
+            paths.append(path)
+
+        expected = sox_effects.apply_effects_files(paths, effects)
+        found = sox_effects.apply_effects_files_parallel(paths, effects, num_threads)
+
+        assert len(found) == len(expected)
+        for (f, f_sr), (e, e_sr) in zip(found, expected):
+            assert f_sr == e_sr
+            self.assertEqual(f, e)
+
+    def test_apply_effects_files_parallel_compand(self):
+        """`apply_effects_files_parallel` gives the same result as sox command for effects which tokenize options"""
+        effects = [["compand", "0.3,1", "6:-70,-60,-20", "-5", "-90", "0.2"]]
+        paths, references = [], []
+        for i in range(8):
+            path = self.get_temp_path(f"input_{i}.wav")
+            reference_path = self.get_temp_path(f"reference_{i}.wav")
+            save_wav(path, get_sinusoid(frequency=400 * (i + 1), sample_rate=8000, n_channels=2), 8000)
+            sox_utils.run_sox_effect(path, reference_path, effects)
+            paths.append(path)
+            references.append(reference_path)
+
+        found = sox_effects.apply_effects_files_parallel(paths, effects, num_threads=4)
+
+        for (f, f_sr), reference_path in zip(found, references):
+            expected, expected_sr = load_wav(reference_path)
+            assert f_sr == expected_sr
+            self.assertEqual(f, expected)
 
 @skipIfNoSox
 class TestFileFormats(TempDirMixin, PytorchTestCase):
@@ -28,6 +28,21 @@ class SoxEffectTensorTransform(torch.nn.Module):
         return sox_effects.apply_effects_tensor(tensor, self.sample_rate, self.effects, self.channels_first)
 
 
+class SoxEffectTensorBatchTransform(torch.nn.Module):
+    effects: List[List[str]]
+
+    def __init__(self, effects: List[List[str]], sample_rate: int, channels_first: bool):
+        super().__init__()
+        self.effects = effects
+        self.sample_rate = sample_rate
+        self.channels_first = channels_first
+
+    def forward(self, wave: torch.Tensor, lengths: torch.Tensor):
+        return sox_effects.apply_effects_tensor_batch(
+            wave, self.sample_rate, self.effects, lengths, self.channels_first
+        )
+
+
 class SoxEffectFileTransform(torch.nn.Module):
     effects: List[List[str]]
     channels_first: bool
@@ -41,6 +56,32 @@ class SoxEffectFileTransform(torch.nn.Module):
         return sox_effects.apply_effects_file(path, self.effects, self.channels_first)
 
 
+class SoxEffectFilesTransform(torch.nn.Module):
+    effects: List[List[str]]
+    channels_first: bool
+
+    def __init__(self, effects: List[List[str]], channels_first: bool):
+        super().__init__()
+        self.effects = effects
+        self.channels_first = channels_first
+
+    def forward(self, paths: List[str]):
+        return sox_effects.apply_effects_files(paths, self.effects, channels_first=self.channels_first)
+
+
+class SoxEffectFilesParallelTransform(torch.nn.Module):
+    effects: List[List[str]]
+    num_threads: int
+
+    def __init__(self, effects: List[List[str]], num_threads: int):
+        super().__init__()
+        self.effects = effects
+        self.num_threads = num_threads
+
+    def forward(self, paths: List[str]):
+        return sox_effects.apply_effects_files_parallel(paths, self.effects, self.num_threads)
+
+
 @skipIfNoSox
 class TestTorchScript(TempDirMixin, TorchaudioTestCase):
     @parameterized.expand(
@@ -66,6 +107,30 @@ class TestTorchScript(TempDirMixin, TorchaudioTestCase):
         assert sr_found == sr_expected
         self.assertEqual(expected, found)
 
+    @parameterized.expand(
+        [
+            ([["lowpass", "-1", "300"], ["vol", "0.5"]],),
+            ([["speed", "0.9"], ["rate", "8000"]],),
+        ]
+    )
+    def test_apply_effects_tensor_batch(self, effects):
+        channels_first = True
+        trans = SoxEffectTensorBatchTransform(effects, 8000, channels_first)
+        trans = torch_script(trans)
+
+        wave = torch.stack(
+            [get_sinusoid(frequency=200 * (i + 1), sample_rate=8000, n_channels=2, dtype="float32") for i in range(3)]
+        )
+        lengths = torch.tensor([8000, 6000, 4000])
+        found, found_lengths, sr_found = trans(wave, lengths)
+        expected, expected_lengths, sr_expected = sox_effects.apply_effects_tensor_batch(
+            wave, 8000, effects, lengths, channels_first
+        )
+
+        assert sr_found == sr_expected
+        self.assertEqual(expected_lengths, found_lengths)
+        self.assertEqual(expected, found)
+
     @parameterized.expand(
         load_params("sox_effect_test_args.jsonl"),
         name_func=lambda f, i, p: f'{f.__name__}_{i}_{p.args[0]["effects"][0][0]}',
@@ -90,3 +155,46 @@ class TestTorchScript(TempDirMixin, TorchaudioTestCase):
 
         assert sr_found == sr_expected
         self.assertEqual(expected, found)
+
+    def test_apply_effects_files(self):
+        effects = [["gain", "-n"], ["rate", "4000"]]
+        channels_first = True
+
+        trans = SoxEffectFilesTransform(effects, channels_first)
+        trans = torch_script(trans)
+
+        paths = []
+        for i, sample_rate in enumerate([8000, 16000]):
+            path = self.get_temp_path(f"input_{i}.wav")
+            wav = get_sinusoid(frequency=800, sample_rate=sample_rate, n_channels=2, dtype="float32")
+            save_wav(path, wav, sample_rate=sample_rate)
+            paths.append(path)
+
+        found = trans(paths)
+        expected = sox_effects.apply_effects_files(paths, effects, channels_first=channels_first)
+
+        assert len(found) == len(expected)
+        for (found_wav, sr_found), (expected_wav, sr_expected) in zip(found, expected):
+            assert sr_found == sr_expected
+            self.assertEqual(expected_wav, found_wav)
+
+    def test_apply_effects_files_parallel(self):
+        effects = [["gain", "-n"], ["rate", "4000"]]
+
+        trans = SoxEffectFilesParallelTransform(effects, 2)
+        trans = torch_script(trans)
+
+        paths = []
+        for i, sample_rate in enumerate([8000, 16000, 8000]):
+            path = self.get_temp_path(f"input_{i}.wav")
+            wav = get_sinusoid(frequency=800, sample_rate=sample_rate, n_channels=2, dtype="float32")
+            save_wav(path, wav, sample_rate=sample_rate)
+            paths.append(path)
+
+        found = trans(paths)
+        expected = sox_effects.apply_effects_files_parallel(paths, effects, 2)
+
+        assert len(found) == len(expected)
+        for (found_wav, sr_found), (expected_wav, sr_expected) in zip(found, expected):
+            assert sr_found == sr_expected
+            self.assertEqual(expected_wav, found_wav)
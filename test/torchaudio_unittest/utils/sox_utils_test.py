@@ -27,6 +27,11 @@ class TestSoxUtils(PytorchTestCase):
         # back to default
         sox_utils.set_use_threads(False)
 
+    def test_prime_fft_cache(self):
+        """`prime_fft_cache` does not crash"""
+        for max_len in [1, 4096, 131072]:
+            sox_utils.prime_fft_cache(max_len)
+
     def test_list_effects(self):
         """`list_effects` returns the list of available effects"""
         effects = sox_utils.list_effects()
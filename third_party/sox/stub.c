@@ -59,6 +59,15 @@ sox_format_t* sox_open_read(
   return NULL;
 }
 
+sox_format_t* sox_open_mem_read(
+    void* buffer,
+    size_t buffer_size,
+    sox_signalinfo_t const* signal,
+    sox_encodinginfo_t const* encoding,
+    char const* filetype) {
+  return NULL;
+}
+
 sox_format_t* sox_open_write(
     char const* path,
     sox_signalinfo_t const* signal,